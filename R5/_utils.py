@@ -1,12 +1,48 @@
+import functools
 import logging
+import time
+
+from anyio import Lock, sleep
+
 
 class R5LoggerAdapter(logging.LoggerAdapter):
+    prefix = '[R5] '
+
     def process(self, msg, kwargs):
-        return f'[R5] {msg}', kwargs
+        if type(msg) is str:
+            return self.prefix + msg, kwargs
+        return f'{self.prefix}{msg}', kwargs
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name):
     logger = logging.getLogger(name)
-    if not logger.handlers:
+    if not logger.hasHandlers():
         logger.addHandler(logging.NullHandler())
-    return R5LoggerAdapter(logger, {})
\ No newline at end of file
+    return R5LoggerAdapter(logger, {})
+
+
+class TokenBucket:
+    """Limitador de tasa: `rate` permisos por segundo con ráfagas de hasta `burst`."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._permits = float(burst)
+        self._last = time.monotonic()
+        self._lock = Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._permits = min(
+            self._burst, self._permits + (now - self._last) * self._rate
+        )
+        self._last = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            if self._permits < 1:
+                await sleep((1 - self._permits) / self._rate)
+                self._refill()
+            self._permits -= 1
\ No newline at end of file
@@ -1,28 +1,54 @@
 import functools
 import inspect
-from collections.abc import Callable
+import logging
+import os
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from contextvars import ContextVar
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from anyio import (
     CapacityLimiter,
     Lock,
+    Semaphore,
     create_task_group,
     get_cancelled_exc_class,
     to_thread,
 )
 from anyio.abc import TaskGroup
 
-from R5._utils import get_logger
+from R5._utils import TokenBucket, get_logger
 from R5.background.errors import BackgroundDisabledError
 from R5.ioc import config, inject, resource
 
 logger = get_logger(__name__)
 
+_NO_GROUP: AbstractAsyncContextManager[Any] = nullcontext()
+
+# Background cuya tarea se está ejecutando; los `add` anidados no ocupan cupo
+# de la cola (esperarían a un cupo que solo liberan ellas mismas).
+_current_background: ContextVar["Background | None"] = ContextVar(
+    "_current_background", default=None
+)
+
+# Errores idénticos repetidos: se loguean los primeros y luego 1 de cada N.
+_ERROR_LOG_FIRST = 10
+_ERROR_LOG_EVERY = 100
+_ERROR_LOG_MAX_KEYS = 1024
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_async_call_type(cls: type) -> bool:
+    call_method = getattr(cls, "__call__", None)
+    return call_method is not None and inspect.iscoroutinefunction(call_method)
+
 
 @config(file="application.yml", required=False)
 class _BackgroundConfig:
     background_enable: bool = True
-    background_max_workers: int = 2
+    background_max_workers: int = min(32, (os.cpu_count() or 1) + 4)
+    background_queue_depth: int = 1024
 
 
 @resource
@@ -35,8 +61,14 @@ class Background:
     Attributes:
         _task_group (anyio.abc.TaskGroup): Grupo de tareas para ejecución concurrente.
         _limiter (anyio.CapacityLimiter): Limitador de capacidad para controlar concurrencia.
+        _queue (anyio.Semaphore): Cupos de tareas encoladas; aplica backpressure en `add`
+            (salvo a los `add` hechos desde una tarea del propio Background).
+        _group_limiters (dict[str, anyio.CapacityLimiter]): Limitadores por grupo de recurso.
+        _rate_limiters (dict[str, TokenBucket]): Límites de tasa por grupo de recurso.
 
     Notes:
+        * El TaskGroup se crea en el primer `add`; un Background resuelto pero
+          sin uso no reserva nada.
         * Soporta inyección de dependencias automática mediante `@R5/ioc`.
         * El manejo de errores está diseñado para no propagar excepciones al hilo principal.
 
@@ -67,14 +99,40 @@ class Background:
             await bg.add(task1)
     """
 
+    __slots__ = (
+        "_config",
+        "_enabled",
+        "_task_group",
+        "_spawn",
+        "_max_workers",
+        "_limiter",
+        "_queue",
+        "_group_limiters",
+        "_rate_limiters",
+        "_started",
+        "_lock",
+        "_async_cache",
+        "_error_counts",
+        "__weakref__",
+    )
+
     @inject
     def __init__(self, config: _BackgroundConfig) -> None:
         self._config = config
+        self._enabled = config.background_enable
         self._task_group: TaskGroup | None = None
+        self._spawn: Callable[..., Any] | None = None
         self._max_workers = config.background_max_workers
         self._limiter = CapacityLimiter(config.background_max_workers)
+        self._queue = Semaphore(config.background_queue_depth)
+        self._group_limiters: dict[str, CapacityLimiter] = {}
+        self._rate_limiters: dict[str, TokenBucket] = {}
         self._started = False
         self._lock = Lock()
+        self._async_cache: WeakKeyDictionary[Callable[..., Any], bool] = (
+            WeakKeyDictionary()
+        )
+        self._error_counts: dict[tuple[type[BaseException], str], int] = {}
 
     async def __aenter__(self) -> "Background":
         return self
@@ -86,47 +144,234 @@ class Background:
             finally:
                 self._started = False
                 self._task_group = None
+                self._spawn = None
+                self._error_counts.clear()
                 logger.debug("Background shutdown completed")
 
     async def add(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
-        if not self._config.background_enable:
+        await self._submit(
+            func, self._is_async_cached(func), args, kwargs, _NO_GROUP, None
+        )
+
+    async def add_to(
+        self, group: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
+        """Encola `func` limitada además por la capacidad del grupo `group`.
+
+        Útil para tareas que comparten un recurso lento (una base de datos, un
+        host externo) sin que acaparen la capacidad global. Los grupos se crean
+        bajo demanda con `background_max_workers` cupos; use `set_group_limit`
+        para ajustarlos.
+        """
+        await self._submit(
+            func,
+            self._is_async_cached(func),
+            args,
+            kwargs,
+            self._get_group_limiter(group),
+            self._rate_limiters.get(group),
+        )
+
+    async def add_many(
+        self,
+        func: Callable[..., Any],
+        args_iter: Iterable[tuple[Any, ...]],
+        **kwargs: Any,
+    ) -> None:
+        """Encola `func` una vez por cada tupla de argumentos de `args_iter`.
+
+        La detección sync/async se resuelve una sola vez para todo el lote y
+        los `kwargs` se comparten entre todas las invocaciones.
+        """
+        is_async = self._is_async_cached(func)
+        submit = self._submit
+        for args in args_iter:
+            await submit(func, is_async, args, kwargs, _NO_GROUP, None)
+
+    async def _submit(
+        self,
+        func: Callable[..., Any],
+        is_async: bool,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        group_limiter: AbstractAsyncContextManager[Any],
+        rate_limiter: TokenBucket | None,
+    ) -> None:
+        # Única ruta de encolado: los add hechos desde una tarea del propio
+        # Background no ocupan cupo de la cola, y un spawn fallido lo devuelve.
+        if not self._enabled:
             raise BackgroundDisabledError
 
+        if not self._started:
+            await self._start()
+
+        spawn = self._spawn
+        if spawn is None:
+            return
+
+        queued = _current_background.get() is not self
+        if queued:
+            await self._queue.acquire()
+        try:
+            spawn(
+                self._safe_task,
+                func,
+                is_async,
+                args,
+                kwargs,
+                group_limiter,
+                rate_limiter,
+                queued,
+            )
+        except BaseException:
+            if queued:
+                self._queue.release()
+            raise
+
+    def set_group_limit(self, group: str, limit: int) -> None:
+        """Fija cuántas tareas del grupo `group` pueden ejecutarse a la vez."""
+        self._get_group_limiter(group).total_tokens = limit
+
+    def set_group_rate(self, group: str, rate: float, burst: int = 1) -> None:
+        """Limita el grupo `group` a `rate` tareas por segundo (ráfagas de `burst`).
+
+        Las tareas que encuentran el cupo agotado esperan su turno antes de
+        ejecutarse, en lugar de saturar el recurso compartido.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self._rate_limiters[group] = TokenBucket(rate, burst)
+
+    def stats(self) -> dict[str, Any]:
+        """Devuelve el número de tareas en ejecución, global y por grupo."""
+        return {
+            "active": self._limiter.borrowed_tokens,
+            "groups": {
+                name: limiter.borrowed_tokens
+                for name, limiter in self._group_limiters.items()
+            },
+        }
+
+    def _get_group_limiter(self, group: str) -> CapacityLimiter:
+        limiter = self._group_limiters.get(group)
+        if limiter is None:
+            limiter = CapacityLimiter(self._max_workers)
+            self._group_limiters[group] = limiter
+        return limiter
+
+    async def _start(self) -> None:
         async with self._lock:
             if not self._started:
                 self._task_group = create_task_group()
                 await self._task_group.__aenter__()
+                self._spawn = self._task_group.start_soon
                 self._started = True
-                logger.debug(f"Background initialized with {self._max_workers} workers")
+                logger.debug("Background initialized with %d workers", self._max_workers)
 
-            if self._task_group:
-                self._task_group.start_soon(self._safe_task, func, args, kwargs)
+    def _is_async_cached(self, func: Callable[..., Any]) -> bool:
+        # Los métodos ligados se recrean en cada acceso; se indexa por la función.
+        key = getattr(func, "__func__", func)
+        try:
+            return self._async_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return self._is_async_callable(func)
+
+        is_async = self._is_async_callable(func)
+        self._async_cache[key] = is_async
+        return is_async
 
     @staticmethod
     def _is_async_callable(func: Callable[..., Any]) -> bool:
-        if isinstance(func, functools.partial):
+        while isinstance(func, functools.partial):
             func = func.func
 
+        code = getattr(getattr(func, "__func__", func), "__code__", None)
+        if code is not None and code.co_flags & inspect.CO_COROUTINE:
+            return True
         if inspect.iscoroutinefunction(func):
             return True
-        if callable(func) and hasattr(func, "__call__"):
-            call_method = getattr(func, "__call__", None)
-            if call_method and inspect.iscoroutinefunction(call_method):
-                return True
-        return False
+        func_type: type = type(func)
+        return _is_async_call_type(func_type)
 
     async def _safe_task(
-        self, func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+        self,
+        func: Callable[..., Any],
+        is_async: bool,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        group_limiter: AbstractAsyncContextManager[Any],
+        rate_limiter: TokenBucket | None,
+        queued: bool,
     ):
-        func_name = getattr(func, "__name__", repr(func))
-
+        _current_background.set(self)
         try:
-            async with self._limiter:
-                if self._is_async_callable(func):
-                    await func(*args, **kwargs)
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            async with group_limiter, self._limiter:
+                if kwargs:
+                    if is_async:
+                        await func(*args, **kwargs)
+                    else:
+                        await to_thread.run_sync(
+                            functools.partial(func, *args, **kwargs)
+                        )
+                elif is_async:
+                    await func(*args)
                 else:
-                    await to_thread.run_sync(functools.partial(func, *args, **kwargs))
+                    await to_thread.run_sync(func, *args)
         except get_cancelled_exc_class():
             raise
-        except Exception:
-            logger.exception(f"Error in background task {func_name}")
+        except OSError as e:
+            # Red/E/S: fallos esperables, sin traceback.
+            self._log_task_error(func, e, logging.WARNING, with_traceback=False)
+        except Exception as e:
+            self._log_task_error(func, e, logging.ERROR, with_traceback=True)
+        finally:
+            if queued:
+                self._queue.release()
+
+    def _log_task_error(
+        self,
+        func: Callable[..., Any],
+        error: Exception,
+        level: int,
+        with_traceback: bool,
+    ) -> None:
+        if not logger.isEnabledFor(level):
+            return
+
+        count = self._count_error(error)
+        if count > _ERROR_LOG_FIRST and count % _ERROR_LOG_EVERY:
+            return
+
+        func_name = getattr(func, "__name__", None) or repr(func)
+        exc_info = error if with_traceback else None
+        if count <= _ERROR_LOG_FIRST:
+            logger.log(
+                level,
+                "Error in background task %s: %r",
+                func_name,
+                error,
+                exc_info=exc_info,
+            )
+        else:
+            logger.log(
+                level,
+                "Error in background task %s: %r (repeated %d times)",
+                func_name,
+                error,
+                count,
+                exc_info=exc_info,
+            )
+
+    def _count_error(self, error: Exception) -> int:
+        key = (type(error), str(error))
+        count = self._error_counts.get(key, 0) + 1
+        if count == 1 and len(self._error_counts) >= _ERROR_LOG_MAX_KEYS:
+            self._error_counts.clear()
+        self._error_counts[key] = count
+        return count
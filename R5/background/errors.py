@@ -1,4 +1,5 @@
 class BackgroundError(Exception):
+    __slots__ = ()
     message = "Background error occurred"
 
     def __init__(self):
@@ -6,4 +7,5 @@ class BackgroundError(Exception):
 
 
 class BackgroundDisabledError(BackgroundError):
+    __slots__ = ()
     message = "Background disabled"
@@ -1,11 +1,26 @@
-from R5.http.errors import (
-    HttpConnectionError,
-    HttpError,
-    HttpMappingError,
-    HttpTimeoutError,
-)
-from R5.http.http import Http
-from R5.http.result import Result
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from R5.http.errors import (
+        HttpConnectionError,
+        HttpError,
+        HttpMappingError,
+        HttpTimeoutError,
+    )
+    from R5.http.http import Http
+    from R5.http.result import Result
+
+# Los submódulos se importan al primer acceso (PEP 562): importar R5.http no
+# carga httpx hasta que se usa Http o Result.
+_LAZY = {
+    "Http": "R5.http.http",
+    "Result": "R5.http.result",
+    "HttpError": "R5.http.errors",
+    "HttpTimeoutError": "R5.http.errors",
+    "HttpConnectionError": "R5.http.errors",
+    "HttpMappingError": "R5.http.errors",
+}
 
 __all__ = [
     "Http",
@@ -15,3 +30,16 @@ __all__ = [
     "HttpConnectionError",
     "HttpMappingError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
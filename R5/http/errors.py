@@ -2,6 +2,7 @@ from typing import Optional
 
 
 class HttpError(Exception):
+    __slots__ = ()
     message = "Http error occurred"
 
     def __init__(self, custom_message: Optional[str] = None):
@@ -10,16 +11,20 @@ class HttpError(Exception):
 
 
 class HttpDisabledException(HttpError):
+    __slots__ = ()
     message = "Http client is disabled"
 
 
 class HttpTimeoutError(HttpError):
+    __slots__ = ()
     message = "Http request timed out"
 
 
 class HttpConnectionError(HttpError):
+    __slots__ = ()
     message = "Http connection error"
 
 
 class HttpMappingError(HttpError):
+    __slots__ = ()
     message = "Http Error mapping response to DTO"
@@ -1,20 +1,38 @@
-from typing import Any, Callable, Optional, Union
-
-from anyio import sleep
+import asyncio
+import functools
+import inspect
+import random
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+from typing import Any, Awaitable, Callable, Optional, Sequence, Union
+from urllib.parse import urlsplit
+
+import anyio
+from anyio import create_task_group, current_time
+from anyio.lowlevel import current_token
 import httpx
 
-from R5._utils import get_logger
+from R5._utils import TokenBucket, get_logger
 from R5.http.errors import HttpConnectionError, HttpDisabledException, HttpTimeoutError
 from R5.http.result import Result
 from R5.ioc import config, inject, resource
 
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 @config(file="application.yml", required=False)
 class HttpConfig:
     http_enable: bool = True
-    http_max_connections: int = 100
-    http_max_keepalive_connections: int = 20
-    http_keepalive_expiry: float = 5.0
+    http_max_connections: int = 256
+    http_max_keepalive_connections: int = 100
+    http_keepalive_expiry: float = 15.0
     http_connect_timeout: float = 5.0
     http_read_timeout: float = 30.0
     http_write_timeout: float = 30.0
@@ -24,7 +42,18 @@ class HttpConfig:
     http_follow_redirects: bool = True
     http_retry_delay: float = 1.0
     http_retry_backoff: float = 2.0
+    http_retry_jitter: float = 0.5
+    http_retry_max_delay: float = 30.0
+    http_request_budget: Optional[float] = None
+    http_rate_limit_rps: float = 0.0
+    http_rate_limit_burst: int = 1
+    http_hedge_after: float = 0.0
     http_proxy: Optional[str] = None
+    http_proxy_pool_size: int = 8
+    http_per_host_pools: bool = False
+    http_host_pool_size: int = 32
+    http_http2: bool = False
+    http_warmup_urls: list[str] = []
 
     def __post_init__(self):
         """Validar configuración al instanciar."""
@@ -42,12 +71,125 @@ class HttpConfig:
             if getattr(self, field) <= 0:
                 raise ValueError(f"{field} must be > 0")
 
+        if self.http_proxy_pool_size <= 0:
+            raise ValueError("http_proxy_pool_size must be > 0")
+
+        if self.http_host_pool_size <= 0:
+            raise ValueError("http_host_pool_size must be > 0")
+
         if self.http_retry_delay < 0:
             raise ValueError("http_retry_delay must be >= 0")
 
         if self.http_retry_backoff < 1:
             raise ValueError("http_retry_backoff must be >= 1")
 
+        if self.http_retry_jitter < 0:
+            raise ValueError("http_retry_jitter must be >= 0")
+
+        if self.http_retry_max_delay < 0:
+            raise ValueError("http_retry_max_delay must be >= 0")
+
+        if self.http_request_budget is not None and self.http_request_budget <= 0:
+            raise ValueError("http_request_budget must be > 0")
+
+        if self.http_rate_limit_rps < 0:
+            raise ValueError("http_rate_limit_rps must be >= 0")
+
+        if self.http_rate_limit_burst < 1:
+            raise ValueError("http_rate_limit_burst must be >= 1")
+
+        if self.http_hedge_after < 0:
+            raise ValueError("http_hedge_after must be >= 0")
+
+
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Solo se duplican (hedging) requests sin efectos secundarios.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+# Errores de httpx traducidos a errores de R5 (en orden de prioridad).
+_ERROR_MAP: dict[type[Exception], tuple[type[Exception], str]] = {
+    httpx.TimeoutException: (HttpTimeoutError, "HTTP request timed out: %s"),
+    httpx.ConnectError: (HttpConnectionError, "HTTP connection error: %s"),
+}
+_error_dispatch: dict[type, Optional[tuple[type[Exception], str]]] = {}
+
+
+def _map_error(
+    exc_type: type[Exception],
+) -> Optional[tuple[type[Exception], str]]:
+    # Resuelve la jerarquía una vez por tipo concreto; luego es un solo dict hit.
+    try:
+        return _error_dispatch[exc_type]
+    except KeyError:
+        pass
+    mapped = None
+    for base, entry in _ERROR_MAP.items():
+        if issubclass(exc_type, base):
+            mapped = entry
+            break
+    _error_dispatch[exc_type] = mapped
+    return mapped
+
+
+def _encode_json(
+    body: Any, headers: Optional[dict[str, str]]
+) -> Optional[tuple[bytes, dict[str, str]]]:
+    # orjson serializa en C; None si no está instalado o no soporta el payload,
+    # en cuyo caso httpx lo codifica con json de la stdlib.
+    if not _HAS_ORJSON:
+        return None
+    try:
+        content = _orjson.dumps(body)
+    except TypeError:
+        return None
+    # orjson escribe NaN/Infinity como null; con un null en la salida se deja a
+    # httpx, que rechaza los floats no finitos con ValueError.
+    if b"null" in content:
+        return None
+    if headers is None:
+        return content, {"Content-Type": "application/json"}
+    if not any(key.lower() == "content-type" for key in headers):
+        headers = {**headers, "Content-Type": "application/json"}
+    return content, headers
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # Retry-After admite segundos ("120") o una fecha HTTP.
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _current_loop() -> object:
+    # Identifica el event loop en curso. En asyncio basta el loop en ejecución
+    # (una llamada en C); current_token() de anyio solo para otros backends.
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return current_token().native_token
+
+
+def _loop_sleep() -> Callable[[float], Awaitable[None]]:
+    # asyncio.sleep directo evita el despacho de backend de anyio.sleep;
+    # en otros backends (trio) se mantiene anyio.sleep.
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return anyio.sleep
+    return asyncio.sleep
+
 
 @resource
 class Http:
@@ -80,16 +222,59 @@ class Http:
     def __init__(self, config: HttpConfig):
         self._config = config
         self._logger = get_logger(__name__)
+        # Valores de config leídos en cada request, fijados al construir.
+        self._enabled = config.http_enable
+        self._proxy = config.http_proxy
+        self._follow_redirects = config.http_follow_redirects
+        self._proxy_pool_size = config.http_proxy_pool_size
+        self._request_budget = config.http_request_budget
+        self._default_retry_delay = config.http_retry_delay
+        self._default_retry_backoff = config.http_retry_backoff
+        self._default_retry_jitter = config.http_retry_jitter
+        self._default_retry_max_delay = config.http_retry_max_delay
+        self._default_hedge_after: Optional[float] = config.http_hedge_after or None
+        self._hedge_after = self._default_hedge_after
+        self._stream = False
+        # True si retry()/hedge() configuraron la próxima request.
+        self._request_configured = False
+        # Token bucket del lado cliente (0 rps = deshabilitado).
+        self._rate_limiter: Optional[TokenBucket] = (
+            TokenBucket(config.http_rate_limit_rps, config.http_rate_limit_burst)
+            if config.http_rate_limit_rps > 0
+            else None
+        )
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: object = None
+        self._proxy_clients: OrderedDict[str, httpx.AsyncClient] = OrderedDict()
+        self._proxy_loop: object = None
+        self._per_host_pools = config.http_per_host_pools
+        self._host_pool_size = config.http_host_pool_size
+        self._host_clients: OrderedDict[str, httpx.AsyncClient] = OrderedDict()
+        self._host_loop: object = None
+        # Clientes desalojados del LRU o de un event loop anterior: otra
+        # corrutina puede seguir usándolos, así que se cierran en close().
+        self._retired_clients: list[httpx.AsyncClient] = []
+        self._warmup_urls = tuple(config.http_warmup_urls)
+        self._http2 = config.http_http2 and _HTTP2_AVAILABLE
+        if config.http_http2 and not _HTTP2_AVAILABLE:
+            self._logger.debug(
+                "http_http2 enabled but 'h2' is not installed; using HTTP/1.1"
+            )
         self._before_handlers: list[Callable[[httpx.Request], None]] = []
         self._after_handlers: list[Callable[[httpx.Request, httpx.Response], None]] = []
         self._retry_attempts: Optional[int] = None
         self._retry_delay: float = config.http_retry_delay
         self._retry_backoff: float = config.http_retry_backoff
-        self._retry_when_status: Optional[tuple[int, ...]] = None
+        self._retry_jitter: float = config.http_retry_jitter
+        self._retry_max_delay: float = config.http_retry_max_delay
+        self._retry_when_status: Optional[frozenset[int]] = None
         self._retry_when_exception: Optional[tuple[type[Exception], ...]] = None
+        # Limits/Timeout/headers no cambian durante la vida del cliente.
+        self._client_config = self._build_client_config()
 
     async def __aenter__(self) -> "Http":
+        if self._warmup_urls and self._enabled:
+            await self.warmup(*self._warmup_urls)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -113,27 +298,103 @@ class Http:
         }
         return limits, timeout, headers
 
-    async def _ensure_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            limits, timeout, headers = self._build_client_config()
-            self._client = httpx.AsyncClient(
-                limits=limits,
-                timeout=timeout,
-                headers=headers,
-                follow_redirects=self._config.http_follow_redirects,
-            )
-        return self._client
+    def _get_client(self) -> httpx.AsyncClient:
+        # El pool de conexiones pertenece al event loop que lo creó; si el
+        # Http se reutiliza desde otro loop se crea un cliente nuevo y el
+        # anterior se cierra en close().
+        client = self._client
+        loop = _current_loop()
+        if client is None or self._client_loop is not loop:
+            if client is not None:
+                self._retired_clients.append(client)
+            client = self._client = self._create_client()
+            self._client_loop = loop
+        return client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        limits, timeout, headers = self._client_config
+        return httpx.AsyncClient(
+            limits=limits,
+            timeout=timeout,
+            headers=headers,
+            follow_redirects=self._follow_redirects,
+            http2=self._http2,
+        )
+
+    def _get_host_client(self, url: str) -> httpx.AsyncClient:
+        # Un cliente por origen (LRU acotado): cada host tiene su propio límite
+        # de conexiones y un pico hacia un host no agota el pool de los demás.
+        loop = _current_loop()
+        if self._host_loop is not loop:
+            self._retired_clients.extend(self._host_clients.values())
+            self._host_clients.clear()
+            self._host_loop = loop
+
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        client = self._host_clients.get(origin)
+        if client is not None and not client.is_closed:
+            self._host_clients.move_to_end(origin)
+            return client
+
+        client = self._create_client()
+        self._host_clients[origin] = client
+        if len(self._host_clients) > self._host_pool_size:
+            _, evicted = self._host_clients.popitem(last=False)
+            self._retired_clients.append(evicted)
+        return client
 
     def _create_proxy_client(self, proxy: str) -> httpx.AsyncClient:
-        limits, timeout, headers = self._build_client_config()
+        limits, timeout, headers = self._client_config
         return httpx.AsyncClient(
             limits=limits,
             timeout=timeout,
             headers=headers,
-            follow_redirects=self._config.http_follow_redirects,
+            follow_redirects=self._follow_redirects,
+            http2=self._http2,
             proxy=proxy,
         )
 
+    def _get_proxy_client(self, proxy: str) -> httpx.AsyncClient:
+        # Un cliente por proxy (LRU acotado) para conservar sus conexiones keep-alive.
+        loop = _current_loop()
+        if self._proxy_loop is not loop:
+            self._retired_clients.extend(self._proxy_clients.values())
+            self._proxy_clients.clear()
+            self._proxy_loop = loop
+
+        client = self._proxy_clients.get(proxy)
+        if client is not None and not client.is_closed:
+            self._proxy_clients.move_to_end(proxy)
+            return client
+
+        client = self._create_proxy_client(proxy)
+        self._proxy_clients[proxy] = client
+        if len(self._proxy_clients) > self._proxy_pool_size:
+            _, evicted = self._proxy_clients.popitem(last=False)
+            self._retired_clients.append(evicted)
+        return client
+
+    async def warmup(self, *urls: str) -> None:
+        """Abre una conexión keep-alive por URL (HEAD concurrente) para que la
+        primera request no pague el handshake. Los errores se ignoran."""
+
+        async def open_connection(url: str) -> None:
+            try:
+                if self._proxy:
+                    client = self._get_proxy_client(self._proxy)
+                elif self._per_host_pools:
+                    client = self._get_host_client(url)
+                else:
+                    client = self._get_client()
+                await client.head(url)
+            except Exception as e:
+                self._logger.debug("Warm-up of %s failed: %s", url, e)
+
+        async with create_task_group() as task_group:
+            for url in urls:
+                task_group.start_soon(open_connection, url)
+
     def on_before(self, handler: Callable[[httpx.Request], None]) -> "Http":
         self._before_handlers.append(handler)
         return self
@@ -151,12 +412,36 @@ class Http:
         backoff: float = 2.0,
         when_status: Optional[tuple[int, ...]] = None,
         when_exception: Optional[tuple[type[Exception], ...]] = None,
+        jitter: Optional[float] = None,
+        max_delay: Optional[float] = None,
     ) -> "Http":
         self._retry_attempts = attempts
         self._retry_delay = delay
         self._retry_backoff = backoff
-        self._retry_when_status = when_status
+        if jitter is not None:
+            self._retry_jitter = jitter
+        if max_delay is not None:
+            self._retry_max_delay = max_delay
+        # frozenset: pertenencia O(1) en cada respuesta del bucle de reintentos.
+        self._retry_when_status = frozenset(when_status) if when_status else None
         self._retry_when_exception = when_exception
+        self._request_configured = True
+        return self
+
+    def hedge(self, after: float) -> "Http":
+        """Si la request no responde en `after` segundos, envía una segunda copia
+        y usa la primera respuesta. Solo aplica a métodos idempotentes."""
+        if after <= 0:
+            raise ValueError("after must be > 0")
+        self._hedge_after = after
+        self._request_configured = True
+        return self
+
+    def stream(self) -> "Http":
+        """No lee el body de la próxima respuesta: se consume con
+        `Result.stream_to()`, que cierra la respuesta al terminar."""
+        self._stream = True
+        self._request_configured = True
         return self
 
     async def request(
@@ -178,6 +463,40 @@ class Http:
         on_exception: Optional[Callable[[Exception], None]] = None,
         **kwargs: Any,
     ) -> Result:
+        if not self._enabled:
+            raise HttpDisabledException
+
+        if json is not None and content is None:
+            encoded = _encode_json(json, headers)
+            if encoded is not None:
+                content, headers = encoded
+                json = None
+
+        # Camino rápido: sin retry, proxy ni handlers (el caso más común).
+        if (
+            not self._request_configured
+            and self._hedge_after is None
+            and proxy is None
+            and self._proxy is None
+            and on_before is None
+            and on_after is None
+            and not self._before_handlers
+            and not self._after_handlers
+        ):
+            return await self._request_fast(
+                method,
+                url,
+                params,
+                json,
+                data,
+                content,
+                headers,
+                timeout,
+                follow_redirects,
+                on_status,
+                on_exception,
+                kwargs,
+            )
         return await self._request(
             method,
             url,
@@ -196,6 +515,57 @@ class Http:
             **kwargs,
         )
 
+    async def _request_fast(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict],
+        json: Optional[dict],
+        data: Any,
+        content: Optional[bytes],
+        headers: Optional[dict[str, str]],
+        timeout: Optional[float],
+        follow_redirects: Optional[bool],
+        on_status: Optional[dict[int, Callable[[], None]]],
+        on_exception: Optional[Callable[[Exception], None]],
+        kwargs: dict[str, Any],
+    ) -> Result:
+        try:
+            if self._per_host_pools:
+                client = self._get_host_client(url)
+            else:
+                client = self._get_client()
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+            request = client.build_request(
+                method,
+                url,
+                params=params,
+                json=json,
+                data=data,
+                content=content,
+                headers=headers,
+                **kwargs,
+            )
+            self._logger.debug("HTTP %s %s", method, url)
+
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            if follow_redirects is None:
+                response = await client.send(request)
+            else:
+                response = await client.send(request, follow_redirects=follow_redirects)
+
+            result = Result.from_response(response)
+            if on_status and result.status in on_status:
+                on_status[result.status]()
+
+            self._logger.debug("Request completed with status %s", result.status)
+            return result
+
+        except Exception as e:
+            return self._handle_exception(e, on_exception)
+
     async def _request(
         self,
         method: str,
@@ -209,84 +579,157 @@ class Http:
         on_exception: Optional[Callable[[Exception], None]] = None,
         **kwargs: Any,
     ) -> Result:
-        if not self._config.http_enable:
-            raise HttpDisabledException
-
         # Determinar proxy efectivo (prioridad: parámetro > config)
-        effective_proxy = proxy if proxy is not None else self._config.http_proxy
+        effective_proxy = proxy if proxy is not None else self._proxy
 
         retry_attempts = self._retry_attempts or 0
+        retry_on_any = self._retry_attempts is not None
+        when_status = self._retry_when_status
+        when_exception = self._retry_when_exception
         current_delay = self._retry_delay
         result: Optional[Result] = None
-        proxy_client: Optional[httpx.AsyncClient] = None
+
+        # Presupuesto total (reloj monotónico del loop) para todos los intentos.
+        budget = self._request_budget
+        deadline = current_time() + budget if budget is not None else None
+        loop_sleep = _loop_sleep() if retry_attempts else None
+        stream = self._stream
+        # Sin hedging en streaming: la respuesta perdedora quedaría sin leer.
+        hedge_after = (
+            self._hedge_after
+            if not stream and method.upper() in _IDEMPOTENT_METHODS
+            else None
+        )
+
+        # Invariantes entre intentos: se calculan una sola vez.
+        per_host_pools = self._per_host_pools
+        rate_limiter = self._rate_limiter
+        request_kwargs = kwargs if timeout is None else {**kwargs, "timeout": timeout}
+        # Handlers globales + del request en una sola secuencia.
+        before_handlers = (
+            self._before_handlers
+            if on_before is None
+            else (*self._before_handlers, on_before)
+        )
+        after_handlers = (
+            self._after_handlers
+            if on_after is None
+            else (*self._after_handlers, on_after)
+        )
+
+        # El cliente se resuelve una vez; el request se construye en cada
+        # intento para que los before-handlers partan de un request limpio y
+        # las cookies de una respuesta anterior se incluyan en el reintento.
+        client: Optional[httpx.AsyncClient] = None
 
         try:
             for attempt in range(retry_attempts + 1):
                 try:
-                    # Usar proxy si está configurado, sino cliente normal
-                    if effective_proxy:
-                        if proxy_client is None:
-                            proxy_client = self._create_proxy_client(effective_proxy)
-                        client = proxy_client
-                    else:
-                        client = await self._ensure_client()
-
-                    request_kwargs = kwargs.copy()
-                    if timeout is not None:
-                        request_kwargs["timeout"] = timeout
-
-                    send_kwargs = {}
-                    if follow_redirects is not None:
-                        send_kwargs["follow_redirects"] = follow_redirects
+                    if client is None:
+                        # Usar proxy si está configurado, sino cliente normal
+                        if effective_proxy:
+                            client = self._get_proxy_client(effective_proxy)
+                        elif per_host_pools:
+                            client = self._get_host_client(url)
+                        else:
+                            client = self._get_client()
 
                     request = client.build_request(method, url, **request_kwargs)
 
                     # Log inicio de request
-                    proxy_info = f" via proxy {effective_proxy}" if effective_proxy else ""
-                    self._logger.debug(f"HTTP {method} {url}{proxy_info}")
-
-                    for handler in self._before_handlers:
-                        handler(request)
-                    if on_before:
-                        on_before(request)
-
-                    response = await client.send(request, **send_kwargs)
+                    if effective_proxy:
+                        self._logger.debug(
+                            "HTTP %s %s via proxy %s", method, url, effective_proxy
+                        )
+                    else:
+                        self._logger.debug("HTTP %s %s", method, url)
+
+                    if before_handlers:
+                        for handler in before_handlers:
+                            handler(request)
+
+                    if rate_limiter is not None:
+                        await rate_limiter.acquire()
+                    if hedge_after is not None:
+                        response = await self._send_hedged(
+                            client,
+                            request,
+                            functools.partial(
+                                client.build_request, method, url, **request_kwargs
+                            ),
+                            before_handlers,
+                            hedge_after,
+                            follow_redirects,
+                        )
+                    elif stream:
+                        response = await self._send_stream(
+                            client, request, follow_redirects
+                        )
+                    elif follow_redirects is None:
+                        response = await client.send(request)
+                    else:
+                        response = await client.send(
+                            request, follow_redirects=follow_redirects
+                        )
 
-                    for handler in self._after_handlers:
-                        handler(request, response)
-                    if on_after:
-                        on_after(request, response)
+                    if after_handlers:
+                        for handler in after_handlers:
+                            handler(request, response)
 
                     result = Result.from_response(response)
 
                     if on_status and result.status in on_status:
                         on_status[result.status]()
 
-                    if self._should_retry_on_status(
-                        result.status, attempt, retry_attempts
+                    if (
+                        when_status
+                        and attempt < retry_attempts
+                        and result.status in when_status
                     ):
+                        wait = self._jittered(current_delay)
+                        retry_after = _parse_retry_after(
+                            response.headers.get("retry-after")
+                        )
+                        if retry_after:
+                            wait = min(self._retry_max_delay, max(wait, retry_after))
                         self._logger.debug(
-                            f"Retrying request (attempt {attempt + 1}/{retry_attempts + 1}) "
-                            f"due to status {result.status}, waiting {current_delay}s"
+                            "Retrying request (attempt %d/%d) due to status %s, "
+                            "waiting %.3fs",
+                            attempt + 1,
+                            retry_attempts + 1,
+                            result.status,
+                            wait,
                         )
-                        await sleep(current_delay)
-                        current_delay *= self._retry_backoff
+                        if not await self._sleep_within(wait, deadline, loop_sleep):
+                            return result
+                        if stream:
+                            await response.aclose()
+                        current_delay = self._next_delay(current_delay)
                         continue
 
                     # Log successful completion
-                    self._logger.debug(f"Request completed with status {result.status}")
+                    self._logger.debug(
+                        "Request completed with status %s", result.status
+                    )
                     return result
 
                 except Exception as e:
                     result = self._handle_exception(e, on_exception)
 
-                    if self._should_retry_on_exception(e, attempt, retry_attempts):
+                    if attempt < retry_attempts and (
+                        isinstance(e, when_exception) if when_exception else retry_on_any
+                    ):
+                        wait = self._jittered(current_delay)
                         self._logger.debug(
-                            f"Retrying request (attempt {attempt + 1}/{retry_attempts + 1}) "
-                            f"due to {type(e).__name__}, waiting {current_delay}s"
+                            "Retrying request (attempt %d/%d) due to %s, waiting %.3fs",
+                            attempt + 1,
+                            retry_attempts + 1,
+                            type(e).__name__,
+                            wait,
                         )
-                        await sleep(current_delay)
-                        current_delay *= self._retry_backoff
+                        if not await self._sleep_within(wait, deadline, loop_sleep):
+                            return result
+                        current_delay = self._next_delay(current_delay)
                         continue
 
                     return result
@@ -296,24 +739,120 @@ class Http:
             )
 
         finally:
-            if proxy_client and not proxy_client.is_closed:
-                await proxy_client.aclose()
-            self._clear_config()
+            # Sin retry()/hedge() los campos ya están en sus valores por defecto.
+            if self._request_configured:
+                self._clear_config()
+
+    async def _send_stream(
+        self,
+        client: httpx.AsyncClient,
+        request: httpx.Request,
+        follow_redirects: Optional[bool],
+    ) -> httpx.Response:
+        if follow_redirects is None:
+            return await client.send(request, stream=True)
+        return await client.send(
+            request, stream=True, follow_redirects=follow_redirects
+        )
+
+    async def _send_hedged(
+        self,
+        client: httpx.AsyncClient,
+        request: httpx.Request,
+        build_request: Callable[[], httpx.Request],
+        before_handlers: Sequence[Callable[[httpx.Request], None]],
+        hedge_after: float,
+        follow_redirects: Optional[bool],
+    ) -> httpx.Response:
+        # Gana la primera respuesta y la otra request se cancela. Si falla la
+        # primera se cancela también la copia y se propaga su error: el hedging
+        # no reintenta (eso lo hacen retry(), el presupuesto y el rate limit).
+        responses: list[httpx.Response] = []
+        errors: list[Exception] = []
+
+        async def send(to_send: httpx.Request) -> httpx.Response:
+            if follow_redirects is None:
+                return await client.send(to_send)
+            return await client.send(to_send, follow_redirects=follow_redirects)
+
+        async with create_task_group() as task_group:
+
+            async def primary() -> None:
+                try:
+                    responses.append(await send(request))
+                except Exception as e:
+                    errors.append(e)
+                task_group.cancel_scope.cancel()
+
+            async def hedge() -> None:
+                await anyio.sleep(hedge_after)
+                self._logger.debug(
+                    "Hedging %s %s after %ss", request.method, request.url, hedge_after
+                )
+                try:
+                    hedge_request = build_request()
+                    for handler in before_handlers:
+                        handler(hedge_request)
+                    if self._rate_limiter is not None:
+                        await self._rate_limiter.acquire()
+                    response = await send(hedge_request)
+                except Exception as e:
+                    # Solo falló la copia: se sigue esperando a la primera.
+                    self._logger.debug("Hedged request failed: %s", e)
+                    return
+                responses.append(response)
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(primary)
+            task_group.start_soon(hedge)
+
+        if responses:
+            return responses[0]
+        raise errors[0]
+
+    async def _sleep_within(
+        self,
+        delay: float,
+        deadline: Optional[float],
+        loop_sleep: Optional[Callable[[float], Awaitable[None]]],
+    ) -> bool:
+        # Duerme hasta el próximo intento sin pasar el deadline; False si se agotó.
+        # `loop_sleep` es None solo sin reintentos configurados.
+        if deadline is not None:
+            remaining = deadline - current_time()
+            if remaining <= 0:
+                self._logger.debug("Request budget exhausted, not retrying")
+                return False
+            delay = min(delay, remaining)
+        if loop_sleep is None:
+            loop_sleep = _loop_sleep()
+        await loop_sleep(delay)
+        return True
+
+    def _jittered(self, delay: float) -> float:
+        # Jitter aleatorio para que clientes concurrentes no reintenten a la vez.
+        return min(
+            self._retry_max_delay, delay * (1 + random.random() * self._retry_jitter)
+        )
+
+    def _next_delay(self, current_delay: float) -> float:
+        # El jitter no se acumula: la base crece solo con el backoff.
+        return min(self._retry_max_delay, current_delay * self._retry_backoff)
 
     def _handle_exception(
         self, e: Exception, on_exception: Optional[Callable[[Exception], None]]
     ) -> Result:
-        response = getattr(e, "response", None)
-
-        if isinstance(e, httpx.TimeoutException):
-            error = HttpTimeoutError()
-            self._logger.warning(f"HTTP request timed out: {e}")
-        elif isinstance(e, httpx.ConnectError):
-            error = HttpConnectionError()
-            self._logger.warning(f"HTTP connection error: {e}")
+        # Solo HTTPStatusError lleva una respuesta asociada.
+        response = e.response if isinstance(e, httpx.HTTPStatusError) else None
+
+        mapped = _map_error(type(e))
+        if mapped is not None:
+            error_type, message = mapped
+            error = error_type()
+            self._logger.warning(message, e)
         else:
             error = e
-            self._logger.warning(f"HTTP error: {type(e).__name__}: {e}")
+            self._logger.warning("HTTP error: %s: %s", type(e).__name__, e)
 
         result = Result.from_exception(error, response)
 
@@ -322,47 +861,69 @@ class Http:
 
         return result
 
-    def _should_retry_on_status(
-        self, status: int, attempt: int, max_attempts: int
-    ) -> bool:
-        return bool(
-            self._retry_when_status
-            and status in self._retry_when_status
-            and attempt < max_attempts
-        )
-
-    def _should_retry_on_exception(
-        self, e: Exception, attempt: int, max_attempts: int
-    ) -> bool:
-        if attempt >= max_attempts:
-            return False
-        if self._retry_when_exception:
-            return isinstance(e, self._retry_when_exception)
-        return self._retry_attempts is not None
-
     def _clear_config(self) -> None:
-        self._retry_attempts = None
-        self._retry_delay = self._config.http_retry_delay
-        self._retry_backoff = self._config.http_retry_backoff
-        self._retry_when_status = None
-        self._retry_when_exception = None
+        (
+            self._retry_attempts,
+            self._retry_delay,
+            self._retry_backoff,
+            self._retry_jitter,
+            self._retry_max_delay,
+            self._retry_when_status,
+            self._retry_when_exception,
+            self._hedge_after,
+            self._stream,
+            self._request_configured,
+        ) = (
+            None,
+            self._default_retry_delay,
+            self._default_retry_backoff,
+            self._default_retry_jitter,
+            self._default_retry_max_delay,
+            None,
+            None,
+            self._default_hedge_after,
+            False,
+            False,
+        )
 
-    async def get(self, url: str, **kwargs: Any) -> Result:
-        return await self.request("GET", url, **kwargs)
+    # Los verbos devuelven directamente la corrutina de request(): se ahorra
+    # un frame y un await por llamada. markcoroutinefunction mantiene
+    # inspect.iscoroutinefunction() en True.
+    @inspect.markcoroutinefunction
+    def get(self, url: str, **kwargs: Any) -> Awaitable[Result]:
+        return self.request("GET", url, **kwargs)
 
-    async def post(self, url: str, **kwargs: Any) -> Result:
-        return await self.request("POST", url, **kwargs)
+    @inspect.markcoroutinefunction
+    def post(self, url: str, **kwargs: Any) -> Awaitable[Result]:
+        return self.request("POST", url, **kwargs)
 
-    async def put(self, url: str, **kwargs: Any) -> Result:
-        return await self.request("PUT", url, **kwargs)
+    @inspect.markcoroutinefunction
+    def put(self, url: str, **kwargs: Any) -> Awaitable[Result]:
+        return self.request("PUT", url, **kwargs)
 
-    async def delete(self, url: str, **kwargs: Any) -> Result:
-        return await self.request("DELETE", url, **kwargs)
+    @inspect.markcoroutinefunction
+    def delete(self, url: str, **kwargs: Any) -> Awaitable[Result]:
+        return self.request("DELETE", url, **kwargs)
 
-    async def patch(self, url: str, **kwargs: Any) -> Result:
-        return await self.request("PATCH", url, **kwargs)
+    @inspect.markcoroutinefunction
+    def patch(self, url: str, **kwargs: Any) -> Awaitable[Result]:
+        return self.request("PATCH", url, **kwargs)
 
     async def close(self):
         if self._client:
             await self._client.aclose()
             self._client = None
+            self._client_loop = None
+        while self._proxy_clients:
+            _, client = self._proxy_clients.popitem()
+            await client.aclose()
+        while self._host_clients:
+            _, client = self._host_clients.popitem()
+            await client.aclose()
+        while self._retired_clients:
+            client = self._retired_clients.pop()
+            try:
+                await client.aclose()
+            except Exception as e:
+                # Puede pertenecer a un event loop que ya no existe.
+                self._logger.debug("Error closing retired HTTP client: %s", e)
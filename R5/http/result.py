@@ -1,15 +1,282 @@
+import functools
+import json
 from dataclasses import dataclass, fields, is_dataclass
-from typing import Callable, Optional, Type, TypeVar, Union, get_args, get_origin
+from types import UnionType
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 import httpx
 
 from R5._utils import get_logger
 
+try:
+    from pydantic import BaseModel as _PydanticBase, TypeAdapter as _TypeAdapter
+
+    _HAS_PYDANTIC = True
+except ImportError:
+    _HAS_PYDANTIC = False
+
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import ijson as _ijson  # type: ignore[import-not-found]
+
+    _HAS_IJSON = True
+except ImportError:
+    _HAS_IJSON = False
+
 T = TypeVar("T")
 _logger = get_logger(__name__)
 
 
-@dataclass
+def _is_optional(type_hint: Any) -> bool:
+    origin = get_origin(type_hint)
+    if origin is Union or origin is UnionType:
+        return type(None) in get_args(type_hint)
+    return False
+
+
+def _load_json(response: httpx.Response) -> Any:
+    # orjson si está instalado; solo UTF-8, el resto lo resuelve httpx/stdlib.
+    if _HAS_ORJSON:
+        content = response.content
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            try:
+                return _orjson.loads(content)
+            except _orjson.JSONDecodeError:
+                pass
+    return response.json()
+
+
+def _is_utf8(response: httpx.Response) -> bool:
+    # Sin charset declarado el body JSON es UTF-8 (RFC 8259).
+    charset = response.charset_encoding
+    return charset is None or charset.lower().replace("_", "-") in ("utf-8", "utf8")
+
+
+def _load_text_json(response: httpx.Response) -> Any:
+    # Body con otro charset: se decodifica según el Content-Type.
+    return json.loads(response.text)
+
+
+def _parse_json(response: httpx.Response) -> Any:
+    try:
+        return _load_json(response)
+    except Exception as e:
+        raise ValueError(f"No se pudo parsear JSON de response: {e}")
+
+
+@functools.lru_cache(maxsize=512)
+def _dataclass_fields(target_type: Any) -> tuple[frozenset[str], tuple[str, ...]]:
+    # (nombres de campos, campos no Optional) de un dataclass. Las anotaciones
+    # en string (PEP 563) se resuelven aquí, una sola vez por tipo.
+    dataclass_fields = fields(target_type)
+    try:
+        hints = get_type_hints(target_type)
+    except Exception:
+        hints = {}
+    return (
+        frozenset(f.name for f in dataclass_fields),
+        tuple(
+            f.name
+            for f in dataclass_fields
+            if not _is_optional(hints.get(f.name, f.type))
+        ),
+    )
+
+
+def _null_fields(data: dict, required: tuple[str, ...]) -> list[str]:
+    return [name for name in required if name in data and data[name] is None]
+
+
+def _build_dataclass(
+    target_type: Any,
+    data: dict,
+    field_names: frozenset[str],
+    required: tuple[str, ...],
+) -> Any:
+    filtered_data = {k: data[k] for k in data.keys() & field_names}
+
+    # Caso común sin nulos: un solo escaneo en C y se omite la validación.
+    if required and None in filtered_data.values():
+        null_fields = _null_fields(filtered_data, required)
+    else:
+        null_fields = None
+    if null_fields:
+        _logger.warning(
+            "Fields %s have None values but are not typed as Optional in %s",
+            null_fields,
+            target_type.__name__,
+        )
+
+    return target_type(**filtered_data)
+
+
+@functools.lru_cache(maxsize=512)
+def _mapper_for(target_type: Any) -> Callable[[httpx.Response], Any]:
+    # La reflexión sobre el tipo destino se hace una vez por tipo; después
+    # solo se invoca el mapper resuelto.
+    if (
+        _HAS_PYDANTIC
+        and isinstance(target_type, type)
+        and issubclass(target_type, _PydanticBase)
+    ):
+        validate_json = target_type.model_validate_json
+        validate = target_type.model_validate
+
+        def map_pydantic(response: httpx.Response) -> Any:
+            # Body UTF-8: Pydantic valida directamente desde los bytes (modo
+            # JSON), sin dict intermedio. Otro charset: modo python sobre el
+            # texto decodificado.
+            if _is_utf8(response):
+                return validate_json(response.content)
+            return validate(_load_text_json(response))
+
+        return map_pydantic
+
+    if is_dataclass(target_type):
+        field_names, required = _dataclass_fields(cast(type, target_type))
+
+        def map_dataclass(response: httpx.Response) -> Any:
+            return _build_dataclass(
+                target_type, _parse_json(response), field_names, required
+            )
+
+        return map_dataclass
+
+    if target_type == dict or hasattr(target_type, "__annotations__"):
+        return _parse_json
+
+    if target_type == list:
+
+        def map_list(response: httpx.Response) -> Any:
+            data = _parse_json(response)
+            if isinstance(data, list):
+                return data
+            raise TypeError(f"Response data no es lista: {type(data)}")
+
+        return map_list
+
+    return _parse_json
+
+
+@functools.lru_cache(maxsize=512)
+def _trusted_mapper_for(target_type: Any) -> Callable[[httpx.Response], Any]:
+    # Solo cambia para modelos Pydantic: model_construct no valida.
+    if (
+        _HAS_PYDANTIC
+        and isinstance(target_type, type)
+        and issubclass(target_type, _PydanticBase)
+    ):
+        construct = target_type.model_construct
+
+        def map_pydantic_trusted(response: httpx.Response) -> Any:
+            return construct(**_parse_json(response))
+
+        return map_pydantic_trusted
+
+    return _mapper_for(target_type)
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+@functools.lru_cache(maxsize=512)
+def _item_mapper_for(target_type: Any) -> Callable[[Any], Any]:
+    # Mapper de un elemento ya parseado (usado al iterar en streaming).
+    if (
+        _HAS_PYDANTIC
+        and isinstance(target_type, type)
+        and issubclass(target_type, _PydanticBase)
+    ):
+        return target_type.model_validate
+
+    if is_dataclass(target_type):
+        field_names, required = _dataclass_fields(cast(type, target_type))
+        return functools.partial(
+            _build_dataclass,
+            target_type,
+            field_names=field_names,
+            required=required,
+        )
+
+    return _identity
+
+
+@functools.lru_cache(maxsize=512)
+def _list_mapper_for(target_type: Any) -> Callable[[httpx.Response], list]:
+    # Pydantic valida la lista completa desde los bytes en una sola llamada.
+    if (
+        _HAS_PYDANTIC
+        and isinstance(target_type, type)
+        and issubclass(target_type, _PydanticBase)
+    ):
+        adapter = _TypeAdapter(list[target_type])
+        validate_json = adapter.validate_json
+        validate = adapter.validate_python
+
+        def map_pydantic_list(response: httpx.Response) -> list:
+            if _is_utf8(response):
+                return validate_json(response.content)
+            return validate(_load_text_json(response))
+
+        return map_pydantic_list
+
+    map_item = _item_mapper_for(target_type)
+
+    def map_items(response: httpx.Response) -> list:
+        data = _parse_json(response)
+        if not isinstance(data, list):
+            raise TypeError(f"Response data no es lista: {type(data)}")
+        if map_item is _identity:
+            return data
+        return [map_item(item) for item in data]
+
+    return map_items
+
+
+async def _iter_json_items(response: httpx.Response) -> AsyncIterator[Any]:
+    # Con ijson se parsea por chunks y la memoria pico es O(elemento);
+    # sin ijson se lee el body completo.
+    if not _HAS_IJSON:
+        await response.aread()
+        data = _parse_json(response)
+        if not isinstance(data, list):
+            raise TypeError(f"Response data no es lista: {type(data)}")
+        for item in data:
+            yield item
+        return
+
+    items = _ijson.sendable_list()
+    parser = _ijson.items_coro(items, "item", use_float=True)
+    async for chunk in response.aiter_bytes():
+        parser.send(chunk)
+        for item in items:
+            yield item
+        del items[:]
+    parser.close()
+    for item in items:
+        yield item
+
+
+@dataclass(slots=True)
 class Result:
     """Wrapper para respuestas HTTP con handlers encadenados y mapeo a tipos."""
 
@@ -20,23 +287,17 @@ class Result:
 
     @staticmethod
     def from_response(response: httpx.Response) -> "Result":
-        return Result(
-            response=response,
-            request=response.request,
-            status=response.status_code,
-            exception=None,
-        )
+        # Posicional (response, request, status, exception): evita el binding
+        # por nombre en cada request.
+        return Result(response, response.request, response.status_code, None)
 
     @staticmethod
     def from_exception(
         error: Exception, response: Optional[httpx.Response] = None
     ) -> "Result":
-        return Result(
-            response=response,
-            request=response.request if response else None,
-            status=response.status_code if response else 0,
-            exception=error,
-        )
+        if response is None:
+            return Result(None, None, 0, error)
+        return Result(response, response.request, response.status_code, error)
 
     def on_status(
         self, status_code: int, handler: Callable[[httpx.Request, httpx.Response], None]
@@ -51,65 +312,63 @@ class Result:
         return self
 
     def _is_optional_type(self, type_hint) -> bool:
-        origin = get_origin(type_hint)
-        if origin is Union:
-            args = get_args(type_hint)
-            return type(None) in args
-        return False
+        return _is_optional(type_hint)
 
     def _validate_null_values(self, data: dict, target_type: Type[T]) -> list[str]:
-        null_fields = []
-        if is_dataclass(target_type):
-            for field_info in fields(target_type):
-                if field_info.name in data and data[field_info.name] is None:
-                    if not self._is_optional_type(field_info.type):
-                        null_fields.append(field_info.name)
-        return null_fields
-
-    def _map_response(self, response: httpx.Response, target_type: Type[T]) -> T:
+        if not is_dataclass(target_type):
+            return []
+        return _null_fields(data, _dataclass_fields(target_type)[1])
+
+    def _map_response(
+        self, response: httpx.Response, target_type: Type[T], trusted: bool = False
+    ) -> T:
+        if trusted:
+            return _trusted_mapper_for(cast(type, target_type))(response)
+        return _mapper_for(cast(type, target_type))(response)
+
+    def to_list(self, target_type: Type[T]) -> Optional[list[T]]:
+        """Mapea un body JSON de tipo lista a `list[target_type]`."""
+        if self.exception or not self.response:
+            return None
         try:
-            data = response.json()
+            return _list_mapper_for(cast(type, target_type))(self.response)
         except Exception as e:
-            raise ValueError(f"No se pudo parsear JSON de response: {e}")
+            _logger.warning(
+                "Failed to map response to list[%s]: %s",
+                target_type.__name__,
+                e,
+                exc_info=True,
+            )
+            return None
 
+    async def stream_to(self, target_type: Type[T]) -> AsyncIterator[T]:
+        """Itera los elementos de una respuesta JSON de tipo lista mapeados a
+        `target_type`, sin cargar todo el body. Requiere `http.stream()`."""
+        if self.exception or not self.response:
+            return
+        map_item = _item_mapper_for(cast(type, target_type))
         try:
-            from pydantic import BaseModel
-
-            if isinstance(target_type, type) and issubclass(target_type, BaseModel):
-                return target_type.model_validate(data)
-        except ImportError:
-            pass
-
-        if is_dataclass(target_type):
-            field_names = {f.name for f in fields(target_type)}
-            filtered_data = {k: v for k, v in data.items() if k in field_names}
-
-            null_fields = self._validate_null_values(filtered_data, target_type)
-            if null_fields:
-                _logger.warning(
-                    f"Fields {null_fields} have None values but are not typed as Optional in {target_type.__name__}"
-                )
-
-            return target_type(**filtered_data)
-
-        if target_type == dict or hasattr(target_type, "__annotations__"):
-            return data  # type: ignore
-
-        if target_type == list:
-            if isinstance(data, list):
-                return data  # type: ignore
-            raise TypeError(f"Response data no es lista: {type(data)}")
+            async for item in _iter_json_items(self.response):
+                yield map_item(item)
+        finally:
+            await self.response.aclose()
 
-        return data  # type: ignore
+    def to(self, target_type: Type[T], *, trusted: bool = False) -> Optional[T]:
+        """Mapea el body JSON a `target_type`.
 
-    def to(self, target_type: Type[T]) -> Optional[T]:
+        Con `trusted=True` los modelos Pydantic se crean con `model_construct`,
+        sin validar ni convertir tipos (los modelos anidados quedan como dict).
+        Usarlo solo con APIs propias cuyo payload ya tiene la forma del modelo.
+        """
         if self.exception or not self.response:
             return None
         try:
-            return self._map_response(self.response, target_type)
+            return self._map_response(self.response, target_type, trusted)
         except Exception as e:
             _logger.warning(
-                f"Failed to map response to {target_type.__name__}: {e}",
-                exc_info=True
+                "Failed to map response to %s: %s",
+                target_type.__name__,
+                e,
+                exc_info=True,
             )
             return None
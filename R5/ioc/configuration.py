@@ -14,17 +14,40 @@ Mejoras:
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any, TypeVar, overload, get_type_hints, get_origin, get_args
+from types import UnionType
+from typing import Any, TypeVar, Union, overload, get_type_hints, get_origin, get_args
 import warnings
 import json
 import os
+import re
 from functools import lru_cache
 
 from R5.ioc.container import Container, Scope
 
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 T = TypeVar("T")
 
+# Una línea `clave = valor` por match (claves y valores sin espacios en los
+# extremos). Se escanea el archivo completo de una vez en vez de línea a línea.
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*([^#=\s][^=\n]*?|)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.M
+)
+# En .properties el separador es el primer '='; si no hay, el primer ':'.
+_PROPERTIES_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"([^#!=\s][^=\n]*?|)[^\S\n]*=[^\S\n]*(.*?)"
+    r"|([^#!:=\s][^:=\n]*?|)[^\S\n]*:[^\S\n]*([^=\n]*?)"
+    r")[^\S\n]*$",
+    re.M,
+)
+
 
 # ============================================================================
 # Configuration Loaders (Private)
@@ -51,21 +74,13 @@ class _EnvLoader(_ConfigLoader):
         )
     
     def load(self, file_path: Path) -> dict[str, Any]:
-        config = {}
         with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    config[key] = value
+            text = f.read()
+        config = {}
+        for key, value in _ENV_LINE_RE.findall(text):
+            if value[:1] in ('"', "'") and value.endswith(value[0]):
+                value = value[1:-1]
+            config[key] = value
         return config
 
 
@@ -74,12 +89,16 @@ class _JsonLoader(_ConfigLoader):
         return file_path.suffix == '.json'
     
     def load(self, file_path: Path) -> dict[str, Any]:
+        if _HAS_ORJSON:
+            with open(file_path, 'rb') as f:
+                return _orjson.loads(f.read())
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
 
 class _YamlLoader(_ConfigLoader):
     _yaml_module = None
+    _loader_cls = None
     
     @classmethod
     def _get_yaml(cls):
@@ -87,6 +106,8 @@ class _YamlLoader(_ConfigLoader):
             try:
                 import yaml
                 cls._yaml_module = yaml
+                # CSafeLoader (libyaml) si PyYAML se compiló con soporte C.
+                cls._loader_cls = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
             except ImportError as e:
                 raise ImportError(
                     "YAML support requires PyYAML. Install it with: pip install pyyaml"
@@ -100,7 +121,7 @@ class _YamlLoader(_ConfigLoader):
         yaml = self._get_yaml()
         
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=self._loader_cls)
         
         if not isinstance(data, dict):
             return {}
@@ -113,32 +134,36 @@ class _PropertiesLoader(_ConfigLoader):
         return file_path.suffix == '.properties'
     
     def load(self, file_path: Path) -> dict[str, Any]:
-        config = {}
         with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#') or line.startswith('!'):
-                    continue
-                if '=' in line or ':' in line:
-                    separator = '=' if '=' in line else ':'
-                    key, value = line.split(separator, 1)
-                    config[key.strip()] = value.strip()
+            text = f.read()
+        config = {}
+        for match in _PROPERTIES_LINE_RE.finditer(text):
+            key, value, colon_key, colon_value = match.groups()
+            if key is None:
+                key, value = colon_key, colon_value
+            config[key] = value
         return config
 
 
 class _ConfigLoaderFactory:
-    _loaders: list[_ConfigLoader] = [
-        _EnvLoader(),
-        _JsonLoader(),
-        _YamlLoader(),
-        _PropertiesLoader(),
-    ]
+    # .env se reconoce por nombre (.env, .env.local, ...) y tiene prioridad;
+    # el resto se resuelve por extensión.
+    _env_loader = _EnvLoader()
+    _loaders_by_suffix: dict[str, _ConfigLoader] = {
+        '.json': _JsonLoader(),
+        '.yml': _YamlLoader(),
+        '.yaml': _YamlLoader(),
+        '.properties': _PropertiesLoader(),
+    }
     
     @classmethod
     def get_loader(cls, file_path: Path) -> _ConfigLoader:
-        for loader in cls._loaders:
-            if loader.can_load(file_path):
-                return loader
+        if cls._env_loader.can_load(file_path):
+            return cls._env_loader
+        
+        loader = cls._loaders_by_suffix.get(file_path.suffix)
+        if loader is not None:
+            return loader
         
         raise ValueError(
             f"No loader found for file: {file_path}. "
@@ -153,6 +178,20 @@ class _ConfigLoaderFactory:
         return loader.load(Path(file_path))
 
 
+@lru_cache(maxsize=1024)
+def _cached_origin_args(type_hint: Any) -> tuple[Any, tuple[Any, ...]]:
+    return get_origin(type_hint), get_args(type_hint)
+
+
+def _origin_args(type_hint: Any) -> tuple[Any, tuple[Any, ...]]:
+    """get_origin/get_args memoizados por type hint."""
+    try:
+        return _cached_origin_args(type_hint)
+    except TypeError:
+        # Type hints no hasheables (p. ej. Annotated con metadata dict)
+        return get_origin(type_hint), get_args(type_hint)
+
+
 class _TypeConverter:
     """Convierte valores de string a tipos específicos."""
     
@@ -160,23 +199,27 @@ class _TypeConverter:
     def convert(value: Any, target_type: Any) -> Any:
         if value is None:
             return None
-        
-        origin = get_origin(target_type)
+        return _TypeConverter.for_type(target_type)(value)
+    
+    @staticmethod
+    def for_type(target_type: Any) -> Callable[[Any], Any]:
+        """Resuelve una vez el conversor de un tipo; se llama por cada valor."""
+        origin = _origin_args(target_type)[0]
         
         if origin is list:
-            return _TypeConverter._convert_to_list(value, target_type)
+            return lambda value: _TypeConverter._convert_to_list(value, target_type)
         elif origin is dict:
-            return _TypeConverter._convert_to_dict(value)
+            return _TypeConverter._convert_to_dict
         elif origin is set:
-            return _TypeConverter._convert_to_set(value, target_type)
+            return lambda value: _TypeConverter._convert_to_set(value, target_type)
         elif origin is tuple:
-            return _TypeConverter._convert_to_tuple(value, target_type)
+            return lambda value: _TypeConverter._convert_to_tuple(value, target_type)
         elif target_type == bool:
-            return _TypeConverter._convert_to_bool(value)
+            return _TypeConverter._convert_to_bool
         elif target_type in {int, float, str}:
-            return _TypeConverter._convert_primitive(value, target_type)
+            return lambda value: _TypeConverter._convert_primitive(value, target_type)
         
-        return value
+        return _identity
     
     @staticmethod
     def _convert_to_bool(value: Any) -> bool:
@@ -202,7 +245,7 @@ class _TypeConverter:
         if isinstance(value, list):
             return value
         if isinstance(value, str):
-            return [v.strip() for v in value.split(',') if v.strip()]
+            return _split_csv(value)
         return list(value) if hasattr(value, '__iter__') else [value]
     
     @staticmethod
@@ -210,7 +253,7 @@ class _TypeConverter:
         if isinstance(value, set):
             return value
         if isinstance(value, str):
-            return {v.strip() for v in value.split(',') if v.strip()}
+            return set(_split_csv(value))
         return set(value) if hasattr(value, '__iter__') else {value}
     
     @staticmethod
@@ -218,7 +261,7 @@ class _TypeConverter:
         if isinstance(value, tuple):
             return value
         if isinstance(value, str):
-            return tuple(v.strip() for v in value.split(',') if v.strip())
+            return tuple(_split_csv(value))
         return tuple(value) if hasattr(value, '__iter__') else (value,)
     
     @staticmethod
@@ -227,28 +270,38 @@ class _TypeConverter:
             return value
         if isinstance(value, str):
             try:
+                if _HAS_ORJSON:
+                    return _orjson.loads(value)
                 return json.loads(value)
-            except json.JSONDecodeError:
+            except ValueError:
+                # orjson.JSONDecodeError y json.JSONDecodeError heredan de ValueError
                 return {}
         return {}
 
 
+def _split_csv(value: str) -> list[str]:
+    """Separa por comas descartando vacíos; un solo strip() por elemento."""
+    return [item for part in value.split(',') if (item := part.strip())]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
 def _normalize_key(key: str, case_sensitive: bool = False) -> str:
     """Normaliza claves para matching."""
     return key if case_sensitive else key.lower()
 
 
-def _match_config_key(attr_name: str, config_data: dict[str, Any], case_sensitive: bool = False) -> Any | None:
-    """Busca una clave en el config con soporte para múltiples formatos."""
+def _build_key_lookup(config_data: dict[str, Any], case_sensitive: bool = False) -> dict[str, Any]:
+    """Indexa el config por clave normalizada (la primera gana si se repite)."""
     if case_sensitive:
-        return config_data.get(attr_name)
+        return config_data
     
-    normalized_attr = _normalize_key(attr_name, case_sensitive)
+    lookup: dict[str, Any] = {}
     for key, value in config_data.items():
-        if _normalize_key(key, case_sensitive) == normalized_attr:
-            return value
-    
-    return None
+        lookup.setdefault(_normalize_key(key), value)
+    return lookup
 
 
 # ============================================================================
@@ -311,32 +364,48 @@ def config(
     def decorator(cls_to_decorate: type[T]) -> type[T]:
         config_data = _load_config_data(file, required)
         type_hints = get_type_hints(cls_to_decorate)
+        converters = {
+            name: _TypeConverter.for_type(hint) for name, hint in type_hints.items()
+        }
+        # Lookups O(1) por campo: claves del archivo y de entorno precalculadas.
+        file_lookup = _build_key_lookup(config_data, case_sensitive)
+        field_keys = {
+            name: (_normalize_key(name, case_sensitive), name.upper())
+            for name in type_hints
+        }
+        
+        public_fields = tuple(
+            (name, hint) for name, hint in type_hints.items() if not name.startswith('_')
+        )
+        # Atributos de clase sin anotación (no callables): se copian a cada instancia.
+        class_defaults = {}
+        for attr_name in dir(cls_to_decorate):
+            if attr_name.startswith('_') or attr_name in type_hints:
+                continue
+            attr_value = getattr(cls_to_decorate, attr_name, None)
+            if not callable(attr_value):
+                class_defaults[attr_name] = attr_value
+        
+        # Slots para los campos declarados; __dict__ se mantiene para
+        # atributos extra (kwargs, defaults sin anotación) y se crea solo si
+        # hace falta.
+        slot_names = tuple(name for name, _ in public_fields) + ('__dict__', '__weakref__')
         
         class ConfigClass:
+            __slots__ = slot_names
             _config_data = config_data
             _type_hints = type_hints
+            _converters = converters
+            _file_lookup = file_lookup
+            _field_keys = field_keys
             _env_override = env_override
             _case_sensitive = case_sensitive
             
             def __init__(self, **kwargs: Any):
-                processed_attrs = set()
-                
-                for attr_name, attr_type in self._type_hints.items():
-                    if attr_name.startswith('_'):
-                        continue
-                    
-                    processed_attrs.add(attr_name)
-                    value = self._get_config_value(attr_name, attr_type)
-                    setattr(self, attr_name, value)
+                for attr_name, attr_type in public_fields:
+                    setattr(self, attr_name, self._get_config_value(attr_name, attr_type))
                 
-                for attr_name in dir(cls_to_decorate):
-                    if attr_name.startswith('_') or attr_name in processed_attrs:
-                        continue
-                    
-                    attr_value = getattr(cls_to_decorate, attr_name, None)
-                    if callable(attr_value):
-                        continue
-                    
+                for attr_name, attr_value in class_defaults.items():
                     setattr(self, attr_name, attr_value)
                 
                 for key, value in kwargs.items():
@@ -346,15 +415,16 @@ def config(
                 value = None
                 source = "default"
                 
+                file_key, env_key = self._field_keys[attr_name]
+                
                 if self._env_override:
-                    env_key = attr_name.upper()
                     env_value = os.environ.get(env_key)
                     if env_value is not None:
                         value = env_value
                         source = "env"
                 
-                if value is None and self._config_data:
-                    file_value = _match_config_key(attr_name, self._config_data, self._case_sensitive)
+                if value is None and self._file_lookup:
+                    file_value = self._file_lookup.get(file_key)
                     if file_value is not None:
                         value = file_value
                         source = "file"
@@ -372,7 +442,7 @@ def config(
                     return None
                 
                 if value is not None and source in ("env", "file"):
-                    value = _TypeConverter.convert(value, attr_type)
+                    value = self._converters[attr_name](value)
                 
                 return value
         
@@ -394,19 +464,9 @@ def config(
 
 def _is_optional(type_hint: Any) -> bool:
     """Verifica si un type hint es Optional (Union con None)."""
-    origin = get_origin(type_hint)
-    if origin is None:
-        return False
-    
-    import typing
-    if hasattr(typing, 'UnionType') and origin is typing.UnionType:
-        args = get_args(type_hint)
+    origin, args = _origin_args(type_hint)
+    if origin is Union or origin is UnionType:
         return type(None) in args
-    
-    if origin is typing.Union:
-        args = get_args(type_hint)
-        return type(None) in args
-    
     return False
 
 
@@ -415,11 +475,10 @@ def _load_config_data(file: str | None, required: bool) -> dict[str, Any]:
     if file is None:
         return {}
     
-    resolved_file = file
-    if not Path(resolved_file).is_absolute():
-        resolved_file = str(Path.cwd() / file)
-    
-    file_path = Path(resolved_file)
+    # Ruta absoluta y normalizada: rutas equivalentes ('./a.yml', 'a.yml',
+    # 'conf/../a.yml') comparten la entrada del cache de load_config. No se
+    # siguen symlinks: el loader se elige por el nombre del archivo.
+    file_path = Path(os.path.abspath(file))
     
     if not file_path.exists():
         if required:
@@ -433,7 +492,7 @@ def _load_config_data(file: str | None, required: bool) -> dict[str, Any]:
         return {}
     
     try:
-        return _ConfigLoaderFactory.load_config(str(file_path))
+        return _ConfigLoaderFactory.load_config(os.fspath(file_path))
     except Exception as e:
         if required:
             raise RuntimeError(
@@ -1,4 +1,3 @@
-import inspect
 import warnings
 from collections.abc import Callable
 from contextvars import ContextVar
@@ -14,6 +13,10 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 
+def _type_name(t: Any) -> str:
+    return f"{t.__module__}.{t.__qualname__}"
+
+
 class Scope(Enum):
     SINGLETON = "singleton"
     FACTORY = "factory"
@@ -22,7 +25,8 @@ class Scope(Enum):
 
 class Container:
     _container_by_type: dict[type[Any] | Callable[..., Any], providers.Provider] = {}
-    _resolution_stack: ContextVar[list[str] | None] = ContextVar(
+    # dict como conjunto ordenado: pertenencia O(1) y orden para el mensaje.
+    _resolution_stack: ContextVar[dict[type, None] | None] = ContextVar(
         "_resolution_stack", default=None
     )
 
@@ -32,13 +36,14 @@ class Container:
 
     @classmethod
     def get_provider(cls, provider_type: type) -> providers.Provider:
-        if provider_type not in cls._container_by_type:
+        provider = cls._container_by_type.get(provider_type)
+        if provider is None:
             available = [
                 f"{t.__module__}.{t.__qualname__}"
                 for t in cls._container_by_type.keys()
             ]
             raise ProviderNotFoundError(provider_type, available)
-        return cls._container_by_type[provider_type]
+        return provider
 
     @classmethod
     def in_provider(cls, provider_type: type) -> bool:
@@ -46,33 +51,36 @@ class Container:
 
     @classmethod
     def alias_provider(cls, alias: type, target: type) -> None:
-        if target not in cls._container_by_type:
+        provider = cls._container_by_type.get(target)
+        if provider is None:
             available = [
                 f"{t.__module__}.{t.__qualname__}"
                 for t in cls._container_by_type.keys()
             ]
             raise ProviderNotFoundError(target, available)
-        cls._container_by_type[alias] = cls._container_by_type[target]
+        cls._container_by_type[alias] = provider
 
     @classmethod
     def resolve(cls, dep_type: Type[T]) -> T:
         stack = cls._resolution_stack.get()
         if stack is None:
-            stack = []
+            stack = {}
             cls._resolution_stack.set(stack)
 
-        dep_name = f"{dep_type.__module__}.{dep_type.__qualname__}"
-
-        if dep_name in stack:
-            stack.append(dep_name)
-            raise CircularDependencyError(stack)
+        if dep_type in stack:
+            # Los nombres solo se formatean al reportar el ciclo.
+            raise CircularDependencyError(
+                [_type_name(t) for t in (*stack, dep_type)]
+            )
 
-        stack.append(dep_name)
+        stack[dep_type] = None
         try:
+            # providers.Singleton ya guarda su instancia (y respeta reset() y
+            # override()): no se mantiene otra caché aquí.
             provider = cls.get_provider(dep_type)
             return provider()
         finally:
-            stack.pop()
+            del stack[dep_type]
             if not stack:
                 cls._resolution_stack.set(None)
 
@@ -99,44 +107,45 @@ class Container:
         provider_class = provider_scope[scope]
 
         if isinstance(func_or_cls, type):
-            try:
-                sig = inspect.signature(func_or_cls.__init__)
-                params = [
-                    p
-                    for p in sig.parameters.values()
-                    if p.name not in ("self", "cls")
-                    and p.annotation != inspect.Parameter.empty
-                ]
-
-                if params:
-                    type_hints = get_type_hints(func_or_cls.__init__)
-                    injectable_params = {}
-                    for p in params:
-                        if p.name in type_hints:
-                            dep_type = type_hints[p.name]
-                            if isinstance(dep_type, type) and cls.in_provider(dep_type):
-                                injectable_params[p.name] = dep_type
-
-                    if injectable_params:
-
-                        def factory(
-                            injectable_params=injectable_params, target_cls=func_or_cls
-                        ):
-                            kwargs = {
-                                param_name: cls.resolve(dep_type)
-                                for param_name, dep_type in injectable_params.items()
-                            }
-                            return target_cls(**kwargs)
-
-                        provider = provider_class(factory)
-                        cls._container_by_type[func_or_cls] = provider
-                        return
-            except Exception:
-                pass
+            injectable_params = cls._injectable_params(func_or_cls)
+            if injectable_params:
+
+                def factory(
+                    injectable_params=injectable_params, target_cls=func_or_cls
+                ):
+                    return target_cls(
+                        **{
+                            param_name: cls.resolve(dep_type)
+                            for param_name, dep_type in injectable_params
+                        }
+                    )
+
+                provider = provider_class(factory)
+                cls._container_by_type[func_or_cls] = provider
+                return
 
         provider = provider_class(func_or_cls)
         cls._container_by_type[func_or_cls] = provider
 
+    @classmethod
+    def _injectable_params(cls, target_cls: type[Any]) -> tuple[tuple[str, type], ...]:
+        # (nombre, tipo) de los parámetros de __init__ con provider registrado.
+        # Depende del estado del container, por eso no se cachea por clase.
+        try:
+            init = target_cls.__init__
+            if not getattr(init, "__annotations__", None):
+                return ()
+            type_hints = get_type_hints(init)
+        except Exception:
+            return ()
+        return tuple(
+            (param_name, dep_type)
+            for param_name, dep_type in type_hints.items()
+            if param_name not in ("return", "self", "cls")
+            and isinstance(dep_type, type)
+            and cls.in_provider(dep_type)
+        )
+
     @classmethod
     def reset(cls) -> None:
         cls._container_by_type.clear()
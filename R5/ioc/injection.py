@@ -1,5 +1,7 @@
 import functools
 import inspect
+from collections.abc import Awaitable
+from types import GeneratorType
 from typing import Any, TypeVar, Callable, get_type_hints, get_origin, get_args, Union
 
 from R5.ioc.container import Container
@@ -28,33 +30,66 @@ def _extract_concrete_type(annotation: Any) -> type | None:
     return None
 
 
+def _positional_index(sig: inspect.Signature) -> dict[str, int]:
+    """Posición de cada parámetro que puede pasarse por posición (-1 si no)."""
+    index: dict[str, int] = {}
+    position = 0
+    for param_name, param in sig.parameters.items():
+        if param.kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            index[param_name] = position
+            position += 1
+        else:
+            index[param_name] = -1
+    return index
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_awaitable_type(cls: type) -> bool:
+    return issubclass(cls, Awaitable)
+
+
+def _is_awaitable(obj: Any) -> bool:
+    # Equivalente a inspect.isawaitable, pero el chequeo contra el ABC
+    # Awaitable se cachea por tipo. Los generadores dependen de la instancia.
+    cls: type = type(obj)
+    if cls is GeneratorType:
+        return inspect.isawaitable(obj)
+    return _is_awaitable_type(cls)
+
+
 def _inject_dependencies(
-    sig: inspect.Signature,
-    deps_to_inject: dict[str, type | None],
+    plan: tuple[tuple[str, type | None, int], ...],
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
     func_name: str,
     is_async: bool,
-) -> dict[str, Any]:
-    bound_args = sig.bind_partial(*args, **kwargs)
-    bound_args.apply_defaults()
-    
-    injected: dict[str, Any] = {}
+) -> list[tuple[str, Any]] | None:
+    """Escribe las dependencias en `kwargs`; devuelve las que hay que await."""
+    pending: list[tuple[str, Any]] | None = None
+    n_args = len(args)
     
-    for param_name, dep_type in deps_to_inject.items():
-        if param_name not in bound_args.arguments:
+    for param_name, dep_type, position in plan:
+        # Sin Signature.bind: basta saber si el caller pasó el parámetro.
+        if param_name not in kwargs and not 0 <= position < n_args:
             if dep_type is None:
-                injected[param_name] = None
+                kwargs[param_name] = None
             else:
                 try:
                     provider_instance = Container.resolve(dep_type)
                     
-                    if inspect.isawaitable(provider_instance):
+                    if _is_awaitable(provider_instance):
                         if not is_async:
+                            if inspect.iscoroutine(provider_instance):
+                                provider_instance.close()  # evita "never awaited"
                             raise AsyncProviderInSyncContextError(dep_type)
-                        injected[param_name] = provider_instance
+                        if pending is None:
+                            pending = []
+                        pending.append((param_name, provider_instance))
                     else:
-                        injected[param_name] = provider_instance
+                        kwargs[param_name] = provider_instance
                         
                 except Exception as e:
                     if isinstance(e, (AsyncProviderInSyncContextError,)):
@@ -63,7 +98,7 @@ def _inject_dependencies(
                         dep_type, param_name, func_name, e
                     ) from e
     
-    return injected
+    return pending
 
 
 def inject(func: F) -> F:
@@ -112,6 +147,10 @@ def inject(func: F) -> F:
         elif is_optional:
             deps_to_inject[param_name] = None
     
+    # Nada que inyectar: la función se devuelve tal cual, sin wrapper.
+    if not deps_to_inject:
+        return func
+    
     new_params = []
     found_first_injectable = False
     
@@ -134,19 +173,28 @@ def inject(func: F) -> F:
     
     new_sig = sig.replace(parameters=new_params)
 
+    positional_index = _positional_index(sig)
+    # Plan fijo (nombre, tipo, posición). Los parámetros con default y los
+    # variádicos (*args/**kwargs) nunca se inyectan: siempre cuentan como
+    # valor recibido, aunque sea vacío.
+    plan = tuple(
+        (param_name, dep_type, positional_index[param_name])
+        for param_name, dep_type in deps_to_inject.items()
+        if sig.parameters[param_name].default is inspect.Parameter.empty
+        and sig.parameters[param_name].kind
+        not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    )
+
     if inspect.iscoroutinefunction(func):
 
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            injected = _inject_dependencies(
-                sig, deps_to_inject, args, kwargs, func.__name__, is_async=True
+            pending = _inject_dependencies(
+                plan, args, kwargs, func.__name__, is_async=True
             )
-            
-            for param_name, provider_instance in injected.items():
-                if inspect.isawaitable(provider_instance):
-                    kwargs[param_name] = await provider_instance
-                else:
-                    kwargs[param_name] = provider_instance
+            if pending:
+                for param_name, awaitable in pending:
+                    kwargs[param_name] = await awaitable
 
             return await func(*args, **kwargs)
 
@@ -156,10 +204,7 @@ def inject(func: F) -> F:
 
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            injected = _inject_dependencies(
-                sig, deps_to_inject, args, kwargs, func.__name__, is_async=False
-            )
-            kwargs.update(injected)
+            _inject_dependencies(plan, args, kwargs, func.__name__, is_async=False)
             return func(*args, **kwargs)
 
         sync_wrapper.__signature__ = new_sig  # type: ignore
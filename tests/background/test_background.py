@@ -10,6 +10,7 @@ Este módulo contiene tests para:
 
 import asyncio
 
+import anyio
 import pytest
 
 from R5.background import Background
@@ -493,3 +494,260 @@ class TestBackgroundWithInject:
 
         assert len(results) == 2
         assert service.call_count == initial_count + 1
+
+
+# ============================================================================
+# TESTS DE OPTIMIZACIONES INTERNAS
+# ============================================================================
+
+
+class TestBackgroundInternals:
+    """Tests para cachés y rutas rápidas internas de Background."""
+
+    @pytest.mark.asyncio
+    async def test_async_detection_is_cached_per_callable(self):
+        """Verifica que la detección async se calcula una sola vez por callable."""
+        results = []
+
+        async def async_task(value: int):
+            results.append(value)
+
+        async with Background() as bg:
+            await bg.add(async_task, 1)
+            await bg.add(async_task, 2)
+            assert bg._async_cache[async_task] is True
+            await asyncio.sleep(0.1)
+
+        assert sorted(results) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_async_detection_bound_method(self):
+        """Verifica que los métodos ligados comparten la entrada de caché."""
+        service = AsyncCallable([])
+
+        class Holder:
+            async def run(self, value: str):
+                service.result_list.append(value)
+
+        holder = Holder()
+
+        async with Background() as bg:
+            await bg.add(holder.run, "a")
+            await bg.add(holder.run, "b")
+            assert bg._async_cache[Holder.run] is True
+            await asyncio.sleep(0.1)
+
+        assert sorted(service.result_list) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_add_many_sync_and_async(self):
+        """Verifica que add_many encola una tarea por tupla de argumentos."""
+        results = []
+
+        def sync_task(value: int, prefix: str = ""):
+            results.append(f"{prefix}{value}")
+
+        async def async_task(value: int):
+            results.append(value)
+
+        async with Background() as bg:
+            await bg.add_many(sync_task, ((i,) for i in range(3)), prefix="s")
+            await bg.add_many(async_task, [(10,), (11,)])
+
+        assert sorted(map(str, results)) == ["10", "11", "s0", "s1", "s2"]
+
+    @pytest.mark.asyncio
+    async def test_add_many_disabled(self):
+        """Verifica que add_many respeta background_enable."""
+        from R5.background import BackgroundDisabledError
+
+        bg = Background()
+        bg._enabled = False
+
+        with pytest.raises(BackgroundDisabledError):
+            await bg.add_many(print, [(1,)])
+
+    def test_is_async_callable_unwraps_nested_partials(self):
+        """Verifica detección async en parciales anidados y callables async."""
+        import functools
+
+        async def async_func(a: int, b: int):
+            pass
+
+        nested = functools.partial(functools.partial(async_func, 1), 2)
+        callable_obj = functools.partial(AsyncCallable([]), "x")
+
+        assert Background._is_async_callable(nested) is True
+        assert Background._is_async_callable(callable_obj) is True
+        assert Background._is_async_callable(lambda: None) is False
+
+    def test_background_supports_weakref(self):
+        """Verifica que Background admite referencias débiles pese a __slots__."""
+        import weakref
+
+        bg = Background()
+        assert weakref.ref(bg)() is bg
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_applies_backpressure(self):
+        """Verifica que add espera cuando la cola de tareas está llena."""
+        from R5.background.background import _BackgroundConfig
+
+        config = _BackgroundConfig()
+        config.background_queue_depth = 1
+        release = asyncio.Event()
+        results = []
+
+        async def blocking_task():
+            await release.wait()
+            results.append("first")
+
+        async with Background(config) as bg:
+            await bg.add(blocking_task)
+            pending_add = asyncio.create_task(bg.add(results.append, "second"))
+            await asyncio.sleep(0.05)
+            assert not pending_add.done()
+
+            release.set()
+            await pending_add
+
+        assert results == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_nested_add_with_full_queue_does_not_deadlock(self):
+        """Verifica que una tarea puede encolar otra aunque la cola esté llena."""
+        from R5.background.background import _BackgroundConfig
+
+        config = _BackgroundConfig()
+        config.background_queue_depth = 1
+        results = []
+
+        async def child():
+            results.append("child")
+
+        async def parent(bg: Background):
+            await bg.add(child)
+            await bg.add_many(results.append, [("many",)])
+            await bg.add_to("db", results.append, "group")
+            results.append("parent")
+
+        with anyio.move_on_after(2) as scope:
+            async with Background(config) as bg:
+                await bg.add(parent, bg)
+
+        assert not scope.cancelled_caught
+        assert sorted(results) == ["child", "group", "many", "parent"]
+
+    @pytest.mark.asyncio
+    async def test_failed_spawn_releases_queue_slot(self):
+        """Verifica que un fallo al lanzar la tarea no consume cupo de la cola."""
+        from R5.background.background import _BackgroundConfig
+
+        config = _BackgroundConfig()
+        config.background_queue_depth = 1
+        results = []
+
+        async with Background(config) as bg:
+            await bg._start()
+            spawn = bg._spawn
+
+            def failing_spawn(*args):
+                raise RuntimeError("spawn failed")
+
+            bg._spawn = failing_spawn
+            with pytest.raises(RuntimeError):
+                await bg.add(results.append, "lost")
+
+            bg._spawn = spawn
+            with anyio.fail_after(1):
+                await bg.add(results.append, "ok")
+
+        assert results == ["ok"]
+
+    @pytest.mark.asyncio
+    async def test_add_to_group_limits_concurrency(self):
+        """Verifica que add_to respeta la capacidad del grupo."""
+        running = []
+        max_running = []
+
+        async def slow_task():
+            running.append(1)
+            max_running.append(len(running))
+            await asyncio.sleep(0.05)
+            running.pop()
+
+        async with Background() as bg:
+            bg.set_group_limit("db", 1)
+            for _ in range(3):
+                await bg.add_to("db", slow_task)
+            await asyncio.sleep(0.01)
+            stats = bg.stats()
+            assert stats["groups"] == {"db": 1}
+            assert stats["active"] == 1
+
+        assert max(max_running) == 1
+        assert len(max_running) == 3
+
+    @pytest.mark.asyncio
+    async def test_group_rate_spaces_out_tasks(self):
+        """Verifica que set_group_rate espacia la ejecución de tareas del grupo."""
+        import time
+
+        timestamps = []
+
+        async def record():
+            timestamps.append(time.monotonic())
+
+        async with Background() as bg:
+            bg.set_group_rate("api", rate=20, burst=1)
+            for _ in range(3):
+                await bg.add_to("api", record)
+
+        assert len(timestamps) == 3
+        assert timestamps[-1] - timestamps[0] >= 0.09
+
+    def test_group_rate_validation(self):
+        """Verifica validación de parámetros de set_group_rate."""
+        bg = Background()
+
+        with pytest.raises(ValueError):
+            bg.set_group_rate("api", rate=0)
+        with pytest.raises(ValueError):
+            bg.set_group_rate("api", rate=1, burst=0)
+
+    @pytest.mark.asyncio
+    async def test_repeated_errors_are_sampled(self, caplog):
+        """Verifica que errores idénticos repetidos no inundan el log."""
+        import logging
+
+        def failing_task():
+            raise ValueError("same error")
+
+        with caplog.at_level(logging.ERROR, logger="R5.background.background"):
+            async with Background() as bg:
+                await bg.add_many(failing_task, [()] * 100)
+
+        records = [r for r in caplog.records if "Error in background task" in r.getMessage()]
+        assert len(records) == 11
+        assert "repeated 100 times" in records[-1].getMessage()
+
+    @pytest.mark.asyncio
+    async def test_os_errors_logged_without_traceback(self, caplog):
+        """Verifica que errores de E/S se loguean como WARNING sin traceback."""
+        import logging
+
+        def io_task():
+            raise ConnectionResetError("peer reset")
+
+        def bug_task():
+            raise KeyError("missing")
+
+        with caplog.at_level(logging.WARNING, logger="R5.background.background"):
+            async with Background() as bg:
+                await bg.add(io_task)
+                await bg.add(bug_task)
+
+        by_level = {r.levelno: r for r in caplog.records}
+        assert by_level[logging.WARNING].exc_info is None
+        assert "peer reset" in by_level[logging.WARNING].getMessage()
+        assert by_level[logging.ERROR].exc_info is not None
@@ -172,6 +172,116 @@ class TestResult:
 
         assert data is None
 
+    def test_to_dict_from_real_response(self):
+        """Test mapeo a dict desde el body de una respuesta real."""
+        response = httpx.Response(
+            200,
+            json={"id": 1, "tags": ["a", "b"]},
+            request=httpx.Request("GET", "https://api.example.com/users/1"),
+        )
+
+        data = Result.from_response(response).to(dict)
+
+        assert data == {"id": 1, "tags": ["a", "b"]}
+
+    def test_to_pydantic_model_from_bytes(self):
+        """Test mapeo a modelo Pydantic directamente desde el body."""
+        from pydantic import BaseModel
+
+        class UserModel(BaseModel):
+            id: int
+            name: str
+
+        response = httpx.Response(
+            200,
+            json={"id": 1, "name": "John Doe", "extra": True},
+            request=httpx.Request("GET", "https://api.example.com/users/1"),
+        )
+
+        user = Result.from_response(response).to(UserModel)
+
+        assert user == UserModel(id=1, name="John Doe")
+
+    def test_to_pydantic_model_with_non_utf8_charset(self):
+        """Test un body con charset distinto de UTF-8 se decodifica antes de validar."""
+        from pydantic import BaseModel
+
+        class UserModel(BaseModel):
+            id: int
+            name: str
+
+        response = httpx.Response(
+            200,
+            content='{"id": 1, "name": "José"}'.encode("latin-1"),
+            headers={"Content-Type": "application/json; charset=latin-1"},
+            request=httpx.Request("GET", "https://api.example.com/users/1"),
+        )
+        result = Result.from_response(response)
+
+        assert result.to(UserModel) == UserModel(id=1, name="José")
+
+        response = httpx.Response(
+            200,
+            content='[{"id": 1, "name": "José"}]'.encode("utf-16"),
+            headers={"Content-Type": "application/json; charset=utf-16"},
+            request=httpx.Request("GET", "https://api.example.com/users"),
+        )
+
+        assert Result.from_response(response).to_list(UserModel) == [
+            UserModel(id=1, name="José")
+        ]
+
+    def test_to_pydantic_trusted_skips_validation(self):
+        """Test trusted=True construye el modelo sin validar."""
+        from pydantic import BaseModel
+
+        class UserModel(BaseModel):
+            id: int
+            name: str
+
+        response = httpx.Response(
+            200,
+            json={"id": "1", "name": "John Doe"},
+            request=httpx.Request("GET", "https://api.example.com/users/1"),
+        )
+        result = Result.from_response(response)
+
+        assert result.to(UserModel).id == 1
+        assert result.to(UserModel, trusted=True).id == "1"
+
+    def test_to_list_maps_each_item(self):
+        """Test to_list mapea cada elemento de un array JSON."""
+        from pydantic import BaseModel
+
+        class UserModel(BaseModel):
+            id: int
+            name: str
+
+        payload = [
+            {"id": 1, "name": "Ana", "email": "ana@test.com"},
+            {"id": 2, "name": "Luis", "email": "luis@test.com"},
+        ]
+        response = httpx.Response(
+            200,
+            json=payload,
+            request=httpx.Request("GET", "https://api.example.com/users"),
+        )
+        result = Result.from_response(response)
+
+        assert [u.name for u in result.to_list(TestUser)] == ["Ana", "Luis"]
+        assert [u.id for u in result.to_list(UserModel)] == [1, 2]
+        assert result.to_list(dict) == payload
+
+    def test_to_list_rejects_non_list(self):
+        """Test to_list retorna None si el body no es una lista."""
+        response = httpx.Response(
+            200,
+            json={"id": 1},
+            request=httpx.Request("GET", "https://api.example.com/users"),
+        )
+
+        assert Result.from_response(response).to_list(TestUser) is None
+
 
 class TestHttp:
     """Tests para la clase Http."""
@@ -300,6 +410,52 @@ class TestHttp:
                 assert isinstance(result.exception, HttpTimeoutError)
                 assert result.status == 0
 
+    @pytest.mark.asyncio
+    async def test_status_error_keeps_response(self, http_client):
+        """Test HTTPStatusError conserva la respuesta en el Result."""
+        request = httpx.Request("GET", "https://api.example.com/test")
+        response = httpx.Response(500, request=request)
+
+        def raise_for_status(req, res):
+            raise httpx.HTTPStatusError("Server error", request=req, response=response)
+
+        async with http_client:
+            with patch.object(
+                httpx.AsyncClient, "send", new_callable=AsyncMock
+            ) as mock_send:
+                mock_send.return_value = response
+
+                result = await http_client.get(
+                    "https://api.example.com/test", on_after=raise_for_status
+                )
+
+                assert isinstance(result.exception, httpx.HTTPStatusError)
+                assert result.response is response
+                assert result.status == 500
+
+    @pytest.mark.asyncio
+    async def test_exception_subclasses_are_mapped(self, http_client):
+        """Test subclases de errores de httpx se traducen a errores de R5."""
+        from R5.http.errors import HttpConnectionError, HttpTimeoutError
+
+        cases = [
+            (httpx.ConnectTimeout("Timeout"), HttpTimeoutError),
+            (httpx.ReadTimeout("Timeout"), HttpTimeoutError),
+            (httpx.ConnectError("Refused"), HttpConnectionError),
+            (ValueError("Other"), ValueError),
+        ]
+
+        async with http_client:
+            for exc, expected in cases:
+                with patch.object(
+                    httpx.AsyncClient, "send", new_callable=AsyncMock
+                ) as mock_send:
+                    mock_send.side_effect = exc
+
+                    result = await http_client.get("https://api.example.com/test")
+
+                    assert isinstance(result.exception, expected)
+
     @pytest.mark.asyncio
     async def test_custom_timeout(self, http_client):
         """Test request con timeout personalizado."""
@@ -343,6 +499,125 @@ class TestHttp:
 
                 assert result.status == 200
 
+    @pytest.mark.asyncio
+    async def test_simple_request_skips_retry_loop(self, http_client):
+        """Test sin retry, proxy ni handlers no pasa por _request."""
+        mock_response = Mock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_request = Mock(spec=httpx.Request)
+        mock_request.url = "https://api.example.com/test"
+        mock_response.request = mock_request
+
+        async with http_client:
+            with (
+                patch.object(
+                    httpx.AsyncClient, "send", new_callable=AsyncMock
+                ) as mock_send,
+                patch.object(http_client, "_request") as mock_slow,
+            ):
+                mock_send.return_value = mock_response
+
+                result = await http_client.get(
+                    "https://api.example.com/test", params={"q": "1"}, timeout=2.0
+                )
+
+                assert result.status == 200
+                mock_slow.assert_not_called()
+                sent = mock_send.call_args.args[0]
+                assert sent.url.params["q"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_global_and_request_handlers_order(self, http_client):
+        """Test los handlers globales se ejecutan antes que los del request."""
+        mock_response = Mock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_request = Mock(spec=httpx.Request)
+        mock_request.url = "https://api.example.com/test"
+        mock_response.request = mock_request
+        calls = []
+
+        async with http_client:
+            with patch.object(
+                httpx.AsyncClient, "send", new_callable=AsyncMock
+            ) as mock_send:
+                mock_send.return_value = mock_response
+
+                http_client.on_before(lambda req: calls.append("global_before"))
+                http_client.on_after(lambda req, res: calls.append("global_after"))
+                await http_client.get(
+                    "https://api.example.com/test",
+                    on_before=lambda req: calls.append("before"),
+                    on_after=lambda req, res: calls.append("after"),
+                )
+
+        assert calls == ["global_before", "before", "global_after", "after"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_client_raises(self):
+        """Test con http_enable=False todas las requests fallan."""
+        from R5.http.errors import HttpDisabledException
+
+        config = HttpConfig()
+        config.http_enable = False
+        http = Http(config)
+
+        with pytest.raises(HttpDisabledException):
+            await http.get("https://api.example.com/test")
+        with pytest.raises(HttpDisabledException):
+            await http.retry(2).post("https://api.example.com/test", json={})
+
+    def test_verbs_are_coroutine_functions(self):
+        """Los verbos siguen reconociéndose como corrutinas."""
+        import inspect
+
+        for verb in ("get", "post", "put", "delete", "patch"):
+            assert inspect.iscoroutinefunction(getattr(Http, verb))
+
+    @pytest.mark.asyncio
+    async def test_json_body_encoded_with_orjson(self, http_client):
+        """Test con orjson instalado el body JSON se envía pre-codificado."""
+        orjson = pytest.importorskip("orjson")
+        mock_response = Mock(spec=httpx.Response)
+        mock_response.status_code = 201
+        mock_response.request = Mock(spec=httpx.Request)
+
+        async with http_client:
+            with patch.object(
+                httpx.AsyncClient, "send", new_callable=AsyncMock
+            ) as mock_send:
+                mock_send.return_value = mock_response
+
+                await http_client.post(
+                    "https://api.example.com/users", json={"name": "John"}
+                )
+
+                sent = mock_send.call_args.args[0]
+                assert sent.content == orjson.dumps({"name": "John"})
+                assert sent.headers["content-type"] == "application/json"
+
+    def test_json_body_with_non_finite_floats_uses_stdlib(self):
+        """Test NaN/inf no se envían como null: se delega en httpx (ValueError)."""
+        pytest.importorskip("orjson")
+        from R5.http.http import _encode_json
+
+        assert _encode_json({"value": float("nan")}, None) is None
+        assert _encode_json({"value": float("inf")}, None) is None
+        assert _encode_json({"value": None}, None) is None
+        assert _encode_json({"value": 1.5}, None) is not None
+
+    def test_client_rebuilt_per_event_loop(self, http_client):
+        """Test el cliente se recrea si cambia el event loop."""
+        import asyncio
+
+        async def get_clients():
+            return http_client._get_client(), http_client._get_client()
+
+        first, same_loop = asyncio.run(get_clients())
+        second, _ = asyncio.run(get_clients())
+
+        assert first is same_loop
+        assert first is not second
+
     @pytest.mark.asyncio
     async def test_close(self, http_client):
         """Test cierre del cliente."""
@@ -362,7 +637,10 @@ class TestHttpConfig:
         """Test configuración por defecto."""
         config = HttpConfig()
 
-        assert config.http_max_connections == 100
+        assert config.http_max_connections == 256
+        assert config.http_max_keepalive_connections == 100
+        assert config.http_keepalive_expiry == 15.0
+        assert config.http_http2 is False
         assert config.http_connect_timeout == 5.0
         assert config.http_user_agent == "R5-HTTP/1.0"
         assert config.http_follow_redirects is True
@@ -580,7 +858,7 @@ class TestRetryWithWhenConditions:
 
         async with http:
             # Simula que la primera llamada falla con 503, segunda con 200
-            with patch.object(http, "_ensure_client") as mock_client_getter:
+            with patch.object(http, "_get_client") as mock_client_getter:
                 mock_client = AsyncMock()
                 mock_client_getter.return_value = mock_client
 
@@ -647,7 +925,7 @@ class TestRetryWithWhenConditions:
             # Test 2: when_status reintenta (simulado con mock)
             on_status_called.clear()
 
-            with patch.object(http, "_ensure_client") as mock_client_getter:
+            with patch.object(http, "_get_client") as mock_client_getter:
                 mock_client = AsyncMock()
                 mock_client_getter.return_value = mock_client
 
@@ -689,7 +967,7 @@ class TestRetryWithWhenConditions:
         call_count = []
 
         async with http:
-            with patch.object(http, "_ensure_client") as mock_client_getter:
+            with patch.object(http, "_get_client") as mock_client_getter:
                 mock_client = AsyncMock()
                 mock_client_getter.return_value = mock_client
 
@@ -727,7 +1005,7 @@ class TestRetryWithWhenConditions:
 
         async with http:
             # Test 1: on_exception ejecuta handler cuando hay error
-            with patch.object(http, "_ensure_client") as mock_client_getter:
+            with patch.object(http, "_get_client") as mock_client_getter:
                 mock_client = AsyncMock()
                 mock_client_getter.return_value = mock_client
 
@@ -757,7 +1035,7 @@ class TestRetryWithWhenConditions:
         events = []
 
         async with http:
-            with patch.object(http, "_ensure_client") as mock_client_getter:
+            with patch.object(http, "_get_client") as mock_client_getter:
                 mock_client = AsyncMock()
                 mock_client_getter.return_value = mock_client
 
@@ -805,6 +1083,440 @@ class TestRetryWithWhenConditions:
                 assert events.count("status:503") == 1  # Handler para 503
                 assert events.count("status:200") == 1  # Handler para 200
 
+    @pytest.mark.asyncio
+    async def test_retry_rebuilds_request_for_mutating_handlers(self):
+        """Cada reintento parte de un request limpio: el handler muta una sola vez."""
+        http = Http(HttpConfig())
+        sent = []
+
+        def sign(request):
+            previous = request.headers.get("X-Signature", "")
+            request.headers["X-Signature"] = previous + "signed"
+
+        async def send(request, **kwargs):
+            sent.append(request)
+            return httpx.Response(503 if len(sent) == 1 else 200, request=request)
+
+        async with http:
+            with patch.object(httpx.AsyncClient, "send", side_effect=send):
+                result = await http.retry(
+                    attempts=2, delay=0.01, when_status=(503,)
+                ).get("http://test.com", on_before=sign)
+
+        assert result.status == 200
+        assert sent[0] is not sent[1]
+        assert [r.headers["X-Signature"] for r in sent] == ["signed", "signed"]
+
+    @pytest.mark.asyncio
+    async def test_retry_includes_cookies_from_previous_attempt(self):
+        """Las cookies de la respuesta fallida se envían en el reintento."""
+        http = Http(HttpConfig())
+        sent = []
+
+        async def send(request, **kwargs):
+            sent.append(request)
+            if len(sent) == 1:
+                response = httpx.Response(
+                    503, headers={"Set-Cookie": "session=abc"}, request=request
+                )
+                http._get_client().cookies.extract_cookies(response)
+                return response
+            return httpx.Response(200, request=request)
+
+        async with http:
+            with patch.object(httpx.AsyncClient, "send", side_effect=send):
+                result = await http.retry(
+                    attempts=2, delay=0.01, when_status=(503,)
+                ).get("http://test.com")
+
+        assert result.status == 200
+        assert "cookie" not in sent[0].headers
+        assert sent[1].headers["cookie"] == "session=abc"
+
+
+class TestRetryBackoff:
+    """Tests para el cálculo del delay entre reintentos."""
+
+    def test_jittered_delay_within_bounds(self):
+        """La espera aplica un jitter acotado sobre el delay base."""
+        config = HttpConfig()
+        config.http_retry_jitter = 0.5
+        http = Http(config)
+
+        for _ in range(50):
+            delay = http._jittered(2.0)
+            assert 2.0 <= delay <= 3.0
+
+    def test_next_delay_does_not_compound_jitter(self):
+        """La base del delay crece solo con el backoff."""
+        http = Http(HttpConfig())
+
+        assert http._next_delay(1.0) == 2.0
+        assert http._next_delay(2.0) == 4.0
+
+    def test_retry_overrides_jitter_and_max_delay(self):
+        """retry() acepta jitter y max_delay por request."""
+        http = Http(HttpConfig())
+
+        http.retry(3, jitter=0.0, max_delay=1.5)
+
+        assert http._jittered(1.0) == 1.0
+        assert http._next_delay(1.0) == 1.5
+        http._clear_config()
+        assert http._retry_max_delay == HttpConfig.http_retry_max_delay
+
+    def test_next_delay_is_capped(self):
+        """El delay nunca supera http_retry_max_delay."""
+        config = HttpConfig()
+        config.http_retry_max_delay = 5.0
+        http = Http(config)
+
+        assert http._next_delay(4.0) == 5.0
+
+    def test_when_status_is_frozenset(self):
+        """when_status se normaliza a frozenset al configurar retry."""
+        http = Http(HttpConfig())
+
+        http.retry(3, when_status=(503, 502, 503))
+        assert http._retry_when_status == frozenset({502, 503})
+
+        http.retry(3, when_status=())
+        assert http._retry_when_status is None
+
+    @pytest.mark.asyncio
+    async def test_request_budget_stops_retries(self):
+        """http_request_budget corta los reintentos al agotarse el presupuesto."""
+        config = HttpConfig()
+        config.http_request_budget = 0.05
+        http = Http(config)
+
+        async with http:
+            with patch.object(http, "_get_client") as mock_client_getter:
+                mock_client = AsyncMock()
+                mock_client_getter.return_value = mock_client
+
+                response = Mock(spec=httpx.Response)
+                response.status_code = 503
+                response.headers = httpx.Headers()
+                request = Mock(spec=httpx.Request)
+                request.url = "http://test.com"
+                request.method = "GET"
+                response.request = request
+
+                mock_client.build_request = Mock(return_value=request)
+                mock_client.send = AsyncMock(return_value=response)
+
+                result = await http.retry(
+                    attempts=10, delay=0.04, backoff=1.0, when_status=(503,)
+                ).get("http://test.com")
+
+                assert result.status == 503
+                assert mock_client.send.await_count < 11
+
+    def test_parse_retry_after(self):
+        """Retry-After se interpreta en segundos o como fecha HTTP."""
+        from datetime import datetime, timedelta, timezone
+        from email.utils import format_datetime
+
+        from R5.http.http import _parse_retry_after
+
+        assert _parse_retry_after("120") == 120.0
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after(Mock()) is None
+        assert _parse_retry_after("not a date") is None
+
+        future = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 < _parse_retry_after(format_datetime(future, usegmt=True)) <= 30
+
+        past = datetime.now(timezone.utc) - timedelta(seconds=30)
+        assert _parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_retry_honors_retry_after(self):
+        """El reintento espera al menos lo indicado por Retry-After."""
+        http = Http(HttpConfig())
+        request = httpx.Request("GET", "http://test.com")
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0.2"}, request=request),
+            httpx.Response(200, request=request),
+        ]
+        waits = []
+
+        async def fake_sleep(delay, deadline, loop_sleep):
+            waits.append(delay)
+            return True
+
+        async with http:
+            with (
+                patch.object(
+                    httpx.AsyncClient, "send", new_callable=AsyncMock
+                ) as mock_send,
+                patch.object(http, "_sleep_within", side_effect=fake_sleep),
+            ):
+                mock_send.side_effect = responses
+
+                result = await http.retry(
+                    attempts=1, delay=0.01, when_status=(429,)
+                ).get("http://test.com")
+
+        assert result.status == 200
+        assert waits == [0.2]
+
+    @pytest.mark.asyncio
+    async def test_retry_config_is_cleared_after_request(self):
+        """La configuración de retry solo aplica a la siguiente request."""
+        http = Http(HttpConfig())
+
+        async with http:
+            with patch.object(
+                httpx.AsyncClient, "send", new_callable=AsyncMock
+            ) as mock_send:
+                mock_send.side_effect = httpx.ConnectError("Refused")
+
+                await http.retry(
+                    attempts=1, delay=0.0, backoff=3.0, when_status=(503,)
+                ).get("http://test.com")
+
+        assert http._retry_attempts is None
+        assert http._retry_when_status is None
+        assert http._retry_backoff == HttpConfig.http_retry_backoff
+
+
+class TestRateLimit:
+    """Tests para el token bucket del lado cliente."""
+
+    def test_disabled_by_default(self):
+        """Sin http_rate_limit_rps no hay limitador."""
+        assert Http(HttpConfig())._rate_limiter is None
+
+    @pytest.mark.asyncio
+    async def test_requests_are_throttled(self):
+        """Las requests que exceden la ráfaga esperan a que haya tokens."""
+        import time
+
+        config = HttpConfig()
+        config.http_rate_limit_rps = 20.0
+        config.http_rate_limit_burst = 2
+        http = Http(config)
+        response = httpx.Response(200, request=httpx.Request("GET", "http://test.com"))
+
+        async with http:
+            with patch.object(
+                httpx.AsyncClient, "send", new_callable=AsyncMock
+            ) as mock_send:
+                mock_send.return_value = response
+
+                start = time.monotonic()
+                for _ in range(4):
+                    await http.get("http://test.com")
+                elapsed = time.monotonic() - start
+
+        assert mock_send.await_count == 4
+        assert elapsed >= 0.09
+
+
+class TestHedging:
+    """Tests para hedging de requests idempotentes."""
+
+    @staticmethod
+    def _slow_first_send(calls, first_delay):
+        import anyio
+
+        async def send(request, **kwargs):
+            calls.append(request)
+            if len(calls) == 1:
+                await anyio.sleep(first_delay)
+            return httpx.Response(200 + len(calls) - 1, request=request)
+
+        return send
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_when_first_is_slow(self):
+        """Si la primera request tarda, gana la copia enviada después."""
+        http = Http(HttpConfig())
+        calls = []
+
+        async with http:
+            with patch.object(
+                httpx.AsyncClient, "send", side_effect=self._slow_first_send(calls, 1.0)
+            ):
+                result = await http.hedge(0.01).get("http://test.com")
+
+        assert len(calls) == 2
+        assert result.status == 201
+        assert http._hedge_after is None
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_first_is_fast(self):
+        """Si la primera responde antes del umbral no se envía la copia."""
+        http = Http(HttpConfig())
+        calls = []
+
+        async with http:
+            with patch.object(
+                httpx.AsyncClient, "send", side_effect=self._slow_first_send(calls, 0.0)
+            ):
+                result = await http.hedge(0.5).get("http://test.com")
+
+        assert len(calls) == 1
+        assert result.status == 200
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_first_fails(self):
+        """Si la primera request falla no se envía la copia: el error se propaga."""
+        import anyio
+
+        from R5.http.errors import HttpConnectionError
+
+        http = Http(HttpConfig())
+        calls = []
+
+        async def send(request, **kwargs):
+            calls.append(request)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async with http:
+            with patch.object(httpx.AsyncClient, "send", side_effect=send):
+                result = await http.hedge(0.05).get("http://test.com")
+                await anyio.sleep(0.1)
+
+        assert len(calls) == 1
+        assert isinstance(result.exception, HttpConnectionError)
+
+    @pytest.mark.asyncio
+    async def test_hedge_failure_waits_for_first(self):
+        """Si solo falla la copia se sigue esperando a la primera request."""
+        import anyio
+
+        http = Http(HttpConfig())
+        calls = []
+
+        async def send(request, **kwargs):
+            calls.append(request)
+            if len(calls) == 1:
+                await anyio.sleep(0.05)
+                return httpx.Response(200, request=request)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async with http:
+            with patch.object(httpx.AsyncClient, "send", side_effect=send):
+                result = await http.hedge(0.01).get("http://test.com")
+
+        assert len(calls) == 2
+        assert result.status == 200
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_methods_are_not_hedged(self):
+        """POST nunca se duplica."""
+        http = Http(HttpConfig())
+        calls = []
+
+        async with http:
+            with patch.object(
+                httpx.AsyncClient, "send", side_effect=self._slow_first_send(calls, 0.05)
+            ):
+                result = await http.hedge(0.01).post("http://test.com", json={})
+
+        assert len(calls) == 1
+        assert result.status == 200
+
+    def test_hedge_validates_delay(self):
+        """hedge() rechaza delays no positivos."""
+        with pytest.raises(ValueError):
+            Http(HttpConfig()).hedge(0)
+
+
+class TestWarmup:
+    """Tests para el warm-up de conexiones."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_urls_on_enter(self):
+        """Al entrar en el contexto se envía un HEAD por URL configurada."""
+        config = HttpConfig()
+        config.http_warmup_urls = ["http://a.test/health", "http://b.test/health"]
+        http = Http(config)
+        sent = []
+
+        async def send(request, **kwargs):
+            sent.append((request.method, str(request.url)))
+            return httpx.Response(200, request=request)
+
+        with patch.object(httpx.AsyncClient, "send", side_effect=send):
+            async with http:
+                pass
+
+        assert sorted(sent) == [
+            ("HEAD", "http://a.test/health"),
+            ("HEAD", "http://b.test/health"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_warmup_ignores_errors(self):
+        """Un warm-up fallido no impide usar el cliente."""
+        http = Http(HttpConfig())
+
+        with patch.object(
+            httpx.AsyncClient, "send", side_effect=httpx.ConnectError("down")
+        ):
+            await http.warmup("http://a.test")
+        await http.close()
+
+    @pytest.mark.asyncio
+    async def test_no_warmup_by_default(self):
+        """Sin http_warmup_urls no se envía nada al entrar."""
+        with patch.object(httpx.AsyncClient, "send", new_callable=AsyncMock) as send:
+            async with Http(HttpConfig()):
+                pass
+
+        send.assert_not_called()
+
+
+class TestStreaming:
+    """Tests para respuestas en streaming."""
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_with_stream_flag(self):
+        """http.stream() envía con stream=True y limpia la config."""
+        http = Http(HttpConfig())
+        seen = {}
+
+        async def send(request, **kwargs):
+            seen.update(kwargs)
+            return httpx.Response(200, request=request, json=[])
+
+        async with http:
+            with patch.object(httpx.AsyncClient, "send", side_effect=send):
+                result = await http.stream().get("http://test.com")
+
+        assert seen.get("stream") is True
+        assert result.status == 200
+        assert http._stream is False
+
+    @pytest.mark.asyncio
+    async def test_stream_to_maps_items(self):
+        """stream_to() itera los elementos mapeados y cierra la respuesta."""
+        response = httpx.Response(
+            200,
+            json=[
+                {"id": 1, "name": "Ana", "email": "ana@test.com"},
+                {"id": 2, "name": "Luis", "email": "luis@test.com", "extra": 1},
+            ],
+            request=httpx.Request("GET", "http://test.com"),
+        )
+        result = Result.from_response(response)
+
+        users = [user async for user in result.stream_to(TestUser)]
+
+        assert [user.name for user in users] == ["Ana", "Luis"]
+        assert response.is_closed
+
+    @pytest.mark.asyncio
+    async def test_stream_to_without_response(self):
+        """stream_to() no produce elementos si hubo excepción."""
+        result = Result.from_exception(Exception("boom"))
+
+        assert [item async for item in result.stream_to(dict)] == []
+
 
 class TestProxy:
     """Tests para configuración de proxy."""
@@ -893,6 +1605,89 @@ class TestProxy:
                 # Debería usar el proxy del request, no el de config
                 mock_create_proxy.assert_called_once_with("http://request-proxy:8080")
 
+    @pytest.mark.asyncio
+    async def test_proxy_clients_are_pooled(self):
+        """Test los clientes por proxy se reutilizan y se expulsan por LRU."""
+        config = HttpConfig()
+        config.http_proxy_pool_size = 1
+        http = Http(config)
+
+        async with http:
+            first = http._get_proxy_client("http://proxy1:8080")
+            assert http._get_proxy_client("http://proxy1:8080") is first
+
+            second = http._get_proxy_client("http://proxy2:8080")
+            # El desalojado sigue abierto: puede haber requests en curso.
+            assert not first.is_closed
+            assert list(http._proxy_clients) == ["http://proxy2:8080"]
+
+            # Cambio de event loop: el cliente anterior no se pierde.
+            http._proxy_loop = None
+            third = http._get_proxy_client("http://proxy2:8080")
+            assert third is not second
+            assert not second.is_closed
+
+        assert first.is_closed and second.is_closed and third.is_closed
+
+    @pytest.mark.asyncio
+    async def test_per_host_pools(self):
+        """Con http_per_host_pools cada origen usa su propio cliente."""
+        config = HttpConfig()
+        config.http_per_host_pools = True
+        http = Http(config)
+
+        async with http:
+            a1 = http._get_host_client("https://a.example.com/users")
+            a2 = http._get_host_client("https://a.example.com/items?x=1")
+            b = http._get_host_client("https://b.example.com/users")
+
+            assert a1 is a2
+            assert a1 is not b
+            assert list(http._host_clients) == [
+                "https://a.example.com",
+                "https://b.example.com",
+            ]
+
+        assert a1.is_closed and b.is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_from_previous_loop_closed_on_exit(self):
+        """Al cambiar de event loop el cliente anterior se cierra en close()."""
+        http = Http(HttpConfig())
+
+        async with http:
+            first = http._get_client()
+            assert http._get_client() is first
+
+            http._client_loop = None
+            second = http._get_client()
+            assert second is not first
+            assert not first.is_closed
+
+        assert first.is_closed and second.is_closed
+
+    @pytest.mark.asyncio
+    async def test_evicted_host_clients_closed_on_exit(self):
+        """Los clientes por host desalojados siguen abiertos hasta close()."""
+        config = HttpConfig()
+        config.http_per_host_pools = True
+        config.http_host_pool_size = 1
+        http = Http(config)
+
+        async with http:
+            a = http._get_host_client("https://a.example.com/")
+            b = http._get_host_client("https://b.example.com/")
+
+            assert list(http._host_clients) == ["https://b.example.com"]
+            assert not a.is_closed
+
+            # Cambio de event loop: el cliente anterior no se pierde.
+            http._host_loop = None
+            c = http._get_host_client("https://c.example.com/")
+            assert not b.is_closed
+
+        assert a.is_closed and b.is_closed and c.is_closed
+
     @pytest.mark.asyncio
     async def test_no_proxy_uses_default_client(self):
         """Test sin proxy usa cliente normal."""
@@ -900,9 +1695,9 @@ class TestProxy:
         http = Http(config)
 
         async with http:
-            with patch.object(http, "_ensure_client") as mock_ensure:
+            with patch.object(http, "_get_client") as mock_get_client:
                 mock_client = AsyncMock()
-                mock_ensure.return_value = mock_client
+                mock_get_client.return_value = mock_client
 
                 response = Mock(spec=httpx.Response)
                 response.status_code = 200
@@ -916,7 +1711,7 @@ class TestProxy:
 
                 await http.get("http://test.com")
 
-                mock_ensure.assert_called()
+                mock_get_client.assert_called()
 
 
 class TestResultNullValidation:
@@ -1080,6 +1875,20 @@ class TestResultNullValidation:
         assert "id" not in null_fields
         assert len(null_fields) == 1
 
+    def test_validate_null_values_with_string_annotations(self):
+        """Anotaciones en string (PEP 563) se resuelven antes de validar."""
+
+        @dataclass
+        class LazyUser:
+            id: "int"
+            name: "str"
+            email: "Optional[str]"
+            nick: "str | None"
+
+        data = {"id": 1, "name": None, "email": None, "nick": None}
+
+        assert Result()._validate_null_values(data, LazyUser) == ["name"]
+
     def test_dataclass_mapping_with_mixed_null_values(self):
         """Test mapeo de dataclass con valores nulos mixtos."""
         mock_response = Mock(spec=httpx.Response)
@@ -1095,3 +1904,28 @@ class TestResultNullValidation:
             assert user.id == 100
             assert user.name == "Alice"
             assert user.email is None
+
+
+class TestLazyExports:
+    """Tests para la carga diferida de R5.http."""
+
+    def test_import_package_does_not_load_httpx(self):
+        """Importar R5.http no debe cargar httpx hasta usar Http/Result."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, R5.http; "
+            "assert 'httpx' not in sys.modules; "
+            "from R5.http import Http, HttpError; "
+            "assert 'httpx' in sys.modules; "
+            "assert Http.__module__ == 'R5.http.http'"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute_raises(self):
+        """Atributos desconocidos deben lanzar AttributeError."""
+        import R5.http
+
+        with pytest.raises(AttributeError):
+            R5.http.DoesNotExist  # noqa: B018
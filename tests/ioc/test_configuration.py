@@ -145,6 +145,39 @@ class TestConfigFormats:
         assert config_instance.host == "127.0.0.1"
         assert config_instance.workers == 8
 
+    def test_env_and_properties_line_parsing(self, tmp_path):
+        """Test parseo de comentarios, comillas y separadores en .env y .properties."""
+        from R5.ioc.configuration import _EnvLoader, _PropertiesLoader
+
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# comentario\n"
+            "\n"
+            "  HOST = localhost  \n"
+            'NAME="R5 App"\n'
+            "TOKEN='a=b'\n"
+            "PASSWORD=abc#123\n"
+            "INVALID LINE\n"
+        )
+        props_file = tmp_path / "app.properties"
+        props_file.write_text(
+            "! comentario\n"
+            "# otro\n"
+            "db.url = jdbc:postgresql://db\n"
+            "db.user: admin\n"
+        )
+
+        assert _EnvLoader().load(env_file) == {
+            "HOST": "localhost",
+            "NAME": "R5 App",
+            "TOKEN": "a=b",
+            "PASSWORD": "abc#123",
+        }
+        assert _PropertiesLoader().load(props_file) == {
+            "db.url": "jdbc:postgresql://db",
+            "db.user": "admin",
+        }
+
 
 class TestConfigFallback:
     """Tests para estrategia de fallback a valores por defecto."""
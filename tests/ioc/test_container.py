@@ -167,6 +167,71 @@ class TestContainerScopes:
         
         assert instance2.counter == 0
         assert instance1 is not instance2
+    
+    def test_resolve_caches_singleton_instance(self):
+        """resolve() reutiliza la instancia singleton hasta el reset."""
+        created = []
+        
+        class MyService:
+            def __init__(self):
+                created.append(self)
+        
+        Container.registry_provider(MyService, Scope.SINGLETON)
+        
+        assert Container.resolve(MyService) is Container.resolve(MyService)
+        assert len(created) == 1
+        
+        Container.reset()
+        Container.registry_provider(MyService, Scope.SINGLETON)
+        
+        assert Container.resolve(MyService) is created[-1]
+        assert len(created) == 2
+    
+    def test_resolve_after_replacing_provider(self):
+        """resolve() no devuelve la instancia cacheada si el provider cambió."""
+        from dependency_injector import providers
+
+        class ServiceA:
+            pass
+
+        class ServiceB:
+            pass
+
+        Container.registry_provider(ServiceA, Scope.SINGLETON)
+        original = Container.resolve(ServiceA)
+
+        Container.get_container()[ServiceA] = providers.Singleton(ServiceB)
+
+        assert isinstance(Container.resolve(ServiceA), ServiceB)
+
+        provider = Container.get_provider(ServiceA)
+        with provider.override(providers.Object(original)):
+            assert Container.resolve(ServiceA) is original
+        assert isinstance(Container.resolve(ServiceA), ServiceB)
+    
+    def test_resolve_after_provider_reset(self):
+        """resolve() crea una instancia nueva tras provider.reset()."""
+        class MyService:
+            pass
+
+        Container.registry_provider(MyService, Scope.SINGLETON)
+        first = Container.resolve(MyService)
+        assert Container.resolve(MyService) is first
+
+        Container.get_provider(MyService).reset()
+
+        second = Container.resolve(MyService)
+        assert second is not first
+        assert Container.resolve(MyService) is second
+    
+    def test_resolve_does_not_cache_factory(self):
+        """resolve() no cachea providers factory."""
+        class MyFactory:
+            pass
+        
+        Container.registry_provider(MyFactory, Scope.FACTORY)
+        
+        assert Container.resolve(MyFactory) is not Container.resolve(MyFactory)
 
 
 class TestContainerState:
@@ -49,6 +49,24 @@ class TestBasicInjection:
         result = handler(manual_arg="manual") # type: ignore
         assert result == "manual:injected"
     
+    def test_explicit_argument_skips_injection(self):
+        """Un argumento pasado por posición o keyword no se inyecta."""
+        @singleton
+        class MyService:
+            def __init__(self):
+                self.value = "injected"
+        
+        @inject
+        def handler(service: MyService, fallback: Optional[MyService] = None):
+            return service.value, fallback
+        
+        explicit = MyService.__new__(MyService)
+        explicit.value = "explicit"
+        
+        assert handler(explicit) == ("explicit", None)
+        assert handler(service=explicit) == ("explicit", None)
+        assert handler() == ("injected", None)  # type: ignore
+    
     def test_inject_preserves_function_metadata(self):
         @singleton
         class MyService:
@@ -78,6 +96,33 @@ class TestAsyncInjection:
         result = await async_handler() # type: ignore
         assert result == "async_test"
     
+    @pytest.mark.asyncio
+    async def test_inject_awaits_async_provider(self):
+        """Un provider que devuelve un awaitable se resuelve con await."""
+        from dependency_injector import providers
+        from R5.ioc import Container
+        from R5.ioc.errors import AsyncProviderInSyncContextError
+        
+        class AsyncService:
+            value = "awaited"
+        
+        async def make_service():
+            return AsyncService()
+        
+        Container.get_container()[AsyncService] = providers.Factory(make_service)
+        
+        @inject
+        async def async_handler(service: AsyncService):
+            return service.value
+        
+        @inject
+        def sync_handler(service: AsyncService):
+            return service.value
+        
+        assert await async_handler() == "awaited"  # type: ignore
+        with pytest.raises(AsyncProviderInSyncContextError):
+            sync_handler()  # type: ignore
+    
     @pytest.mark.asyncio
     async def test_inject_multiple_async(self):
         @singleton
@@ -441,6 +486,25 @@ class TestKeywordOnlyEdgeCases:
         result = handler("X", p2=10)  # type: ignore
         assert result == ("X", "S1", 10)
     
+    def test_variadic_params_are_not_injected(self):
+        """*args y **kwargs anotados con un servicio no se inyectan."""
+        @singleton
+        class MyService:
+            pass
+        
+        @inject
+        def handler(service: MyService, *extra: MyService, **opts: MyService):
+            return type(service).__name__, extra, opts
+        
+        assert handler() == ("MyService", (), {})  # type: ignore
+        
+        other = MyService()
+        assert handler(other, other, named=other) == (  # type: ignore
+            "MyService",
+            (other,),
+            {"named": other},
+        )
+    
     def test_no_params_at_all(self):
         """Función sin parámetros no se modifica."""
         @inject
@@ -453,6 +517,13 @@ class TestKeywordOnlyEdgeCases:
         result = no_params()  # type: ignore
         assert result == "no_params"
     
+    def test_no_injectable_params_returns_function_unwrapped(self):
+        """Sin dependencias registradas no se agrega wrapper."""
+        def plain(user_id: str, count: int = 1):
+            return user_id, count
+        
+        assert inject(plain) is plain
+    
     def test_self_parameter_ignored(self):
         """El parámetro 'self' debe ser ignorado."""
         @singleton